@@ -1,6 +1,5 @@
-Z=print
 n=int(input())
 l=''
 while n>0:l=chr(65+n%26)+l;n//=26
-if l:Z(l)
-else:Z('A')
\ No newline at end of file
+if l:print(l)
+else:print('A')
\ No newline at end of file
@@ -1,7 +1,7 @@
-Z=input()
+X=input()
 Y=0
-X=''
-for x in Z:
- if x.isalpha():X+=x.lower()if Y%2 else x.upper();Y+=1
- else:X+=x
-print(X)
\ No newline at end of file
+Z=''
+for x in X:
+ if x.isalpha():Z+=x.lower()if Y%2 else x.upper();Y+=1
+ else:Z+=x
+print(Z)
\ No newline at end of file
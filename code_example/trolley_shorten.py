@@ -1,8 +1,7 @@
-V=input
-n=int(V())
+n=int(input())
 Z=float('inf')
 Y=0
 for i in range(n):
- q,v=map(int,V().split())
+ q,v=map(int,input().split())
  if q*v<Z:Z=q*v;Y=i+1
 print(Y)
\ No newline at end of file
@@ -0,0 +1 @@
+__version__: str = "1.0.2"
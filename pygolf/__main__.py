@@ -5,23 +5,60 @@ from typing import *
 import pyperclip  # type: ignore
 from astroid import AstroidSyntaxError
 
+from pygolf.beam_search import BeamSearch
+from pygolf.cache import CacheBackend, SQLiteCache, default_cache_path
 from pygolf.pygolfer import Pygolfer
 
 
-def statistics(old_code: str, new_code: str) -> str:
+class OutputFile:
+    """Text file opened on the first write, so that an existing file is kept if nothing is shortened into it."""
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self.fp: Optional[TextIO] = None
+
+    def write(self, text: str) -> int:
+        if self.fp is None:
+            self.fp = open(self.path, "w")
+        return self.fp.write(text)
+
+    def close(self) -> None:
+        if self.fp is not None:
+            self.fp.close()
+
+
+def statistics(old_code: str, new_code_length: int) -> str:
     return f"""-----
-Saved {len(old_code) - len(new_code)} characters
-The reduced code has {len(new_code)} characters"""
+Saved {len(old_code) - new_code_length} characters
+The reduced code has {new_code_length} characters"""
 
 
-def shorten(code: str) -> Optional[str]:
-    pygolfer = Pygolfer()
+def shorten(code: str, cache: Optional[CacheBackend] = None, search: Optional[BeamSearch] = None) -> Optional[str]:
+    pygolfer = Pygolfer(cache=cache)
     try:
-        return pygolfer.shorten(code)
+        return pygolfer.shorten(code) if search is None else search.shorten(code)
     except AstroidSyntaxError:
         return None
 
 
+def shorten_to_file(
+    code: str, path: str, cache: Optional[CacheBackend] = None, search: Optional[BeamSearch] = None
+) -> Optional[int]:
+    pygolfer = Pygolfer(cache=cache)
+    output_file = OutputFile(path)
+    try:
+        if search is None:
+            new_code_length = pygolfer.shorten_to(code, output_file)  # type: ignore
+        else:
+            new_code_length = output_file.write(search.shorten(code))
+        output_file.write("")  # Creates the file even if the shortened code is empty
+        return new_code_length
+    except AstroidSyntaxError:
+        return None
+    finally:
+        output_file.close()
+
+
 def read_input_code(arguments: Namespace) -> str:
     if arguments.clipboard:
         return pyperclip.paste()  # type: ignore
@@ -43,12 +80,8 @@ def output_code(arguments: Namespace, old_code: str, new_code: Optional[str]) ->
     elif arguments.code is not None:
         print(new_code)
     elif arguments.input_file is not None:
-        if arguments.output_file:
-            with open(arguments.output_file, "w") as fp:
-                fp.write(new_code)
-        else:
-            print(new_code)
-    print(statistics(old_code, new_code), file=sys.stderr)
+        print(new_code)
+    print(statistics(old_code, len(new_code)), file=sys.stderr)
 
 
 def get_arguments_warning(arguments: Namespace) -> Iterator[str]:
@@ -75,6 +108,26 @@ def parse_arguments(argv: Optional[Sequence[str]] = None) -> Namespace:
         "-o", "--output_file", help="Outputs the code to given output_file or stdout by default", nargs="?",
     )
 
+    parser.add_argument(
+        "--cache",
+        help=f"Reuses the codes shortened previously, stored in the given sqlite file or in {default_cache_path()}",
+        nargs="?",
+        const=default_cache_path(),
+    )
+
+    parser.add_argument(
+        "--beam",
+        help="Searches the orders in which the rules are applied, keeping the given number of codes at each step",
+        type=int,
+    )
+
+    parser.add_argument(
+        "--time_budget",
+        help="Stops the search of --beam after the given number of seconds, 10 by default",
+        type=float,
+        default=10,
+    )
+
     return parser.parse_args(argv)
 
 
@@ -86,7 +139,18 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
 
     input_code = read_input_code(arguments)
 
-    reduced_code = shorten(input_code)
+    cache = SQLiteCache(arguments.cache) if arguments.cache is not None else None
+    search = BeamSearch(arguments.beam, arguments.time_budget) if arguments.beam is not None else None
+
+    if arguments.input_file is not None and arguments.output_file:
+        reduced_code_length = shorten_to_file(input_code, arguments.output_file, cache, search)
+        if reduced_code_length is None:
+            print("Input code is not a valid python code")
+        else:
+            print(statistics(input_code, reduced_code_length), file=sys.stderr)
+        return
+
+    reduced_code = shorten(input_code, cache, search)
 
     output_code(arguments, input_code, reduced_code)
 
@@ -0,0 +1,7 @@
+from typing import List
+
+from .astroid_backend import AstroidBackend
+from .parse_backend import ParseBackend
+from .stdlib_backend import StdlibBackend
+
+__all__: List[str] = ["AstroidBackend", "ParseBackend", "StdlibBackend"]
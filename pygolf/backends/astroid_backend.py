@@ -0,0 +1,15 @@
+import astroid as ast
+from astroid.node_classes import NodeNG
+
+from .parse_backend import ParseBackend
+
+
+class AstroidBackend(ParseBackend):
+    """Builds the module with `astroid.parse`.
+
+    On top of building the tree, astroid caches the module, imports the modules of `from module import *` statements,
+    infers the attributes assigned on instances and applies the transforms of its plugins.
+    """
+
+    def parse(self, code: str) -> NodeNG:
+        return ast.parse(code)
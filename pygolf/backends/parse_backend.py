@@ -0,0 +1,13 @@
+import abc
+
+from astroid.node_classes import NodeNG
+
+
+class ParseBackend(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    def parse(self, code: str) -> NodeNG:
+        """Returns the astroid module of `code`, raises `AstroidSyntaxError` if `code` is not valid python code."""
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return self.__class__.__name__
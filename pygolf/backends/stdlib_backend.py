@@ -0,0 +1,22 @@
+import ast
+
+from astroid import MANAGER, AstroidSyntaxError
+from astroid.node_classes import NodeNG
+from astroid.rebuilder import TreeRebuilder
+
+from .parse_backend import ParseBackend
+
+
+class StdlibBackend(ParseBackend):
+    """Parses the code with the stdlib `ast` module and converts its tree to astroid nodes.
+
+    The steps astroid runs once the tree is built are skipped, pygolf only needs the nodes.
+    """
+
+    def parse(self, code: str) -> NodeNG:
+        try:
+            tree = ast.parse(code + "\n")
+        except (TypeError, ValueError, SyntaxError) as error:
+            raise AstroidSyntaxError("Parsing Python code failed:\n{error}", source=code, error=error) from error
+
+        return TreeRebuilder(MANAGER).visit_module(tree, "", "<?>", False)
@@ -0,0 +1,116 @@
+import time
+from typing import *
+
+from astroid import AstroidSyntaxError
+from astroid.node_classes import NodeNG
+
+from pygolf.backends import AstroidBackend, ParseBackend
+from pygolf.cancellation import CancellationToken, Deadline
+from pygolf.errors.operation_cancelled import OperationCancelled
+from pygolf.helper.node_index import NodeIndex
+from pygolf.optimization_phases import Phase, all_phases
+from pygolf.pygolfer import Pygolfer
+from pygolf.rules import AstroidRule, RuleRegistry
+from pygolf.unparser import Unparser
+
+
+class BeamSearch:
+    """Shortens a code by searching the orders in which the phases, and the rules of the phases, are applied.
+
+    A step applies the rules of a phase to a code, or a single one of them if the rules of the phase are independent.
+    The search starts from the code and from its shortening by `Pygolfer`, and keeps the `width` shortest codes
+    reached by each round of steps. A code is expanded once, however many orders of steps reach it.
+    It stops when no new code is reached, or after `time_budget` seconds, and returns the shortest code it reached.
+    The codes are parsed once, when they are kept, and the codes which cannot be parsed are dropped:
+    the steps from a code are applied to copies of its tree.
+    """
+
+    def __init__(
+        self,
+        width: int = 4,
+        time_budget: Optional[float] = None,
+        phases: Optional[List[Phase]] = None,
+        backend: Optional[ParseBackend] = None,
+    ) -> None:
+        self.width: int = width
+        self.time_budget: Optional[float] = time_budget
+        self.phases: List[Phase] = all_phases if phases is None else phases
+        self.backend: ParseBackend = AstroidBackend() if backend is None else backend
+        # Codes reached by a step during the last search, and its duration in seconds
+        self.explored: int = 0
+        self.duration: float = 0.0
+
+    def nodes_per_second(self) -> float:
+        """Returns the number of codes reached by a step per second during the last search."""
+        return self.explored / self.duration if self.duration else 0.0
+
+    def shorten(self, code: str) -> str:
+        start: float = time.perf_counter()
+        self.explored = 0
+        cancellation: CancellationToken = CancellationToken() if self.time_budget is None else Deadline.after(self.time_budget)
+        states: List[str] = [
+            Unparser().unparse(self.backend.parse(code)),
+            Pygolfer(self.phases, backend=self.backend).shorten(code, cancellation=cancellation),
+        ]
+        # Codes reached so far, which are never expanded twice
+        seen: Set[str] = set(states)
+        frontier: List[Tuple[str, NodeNG]] = self._parsed(states)
+        # The unparser does not always give valid code, the output of `Pygolfer` is kept if no code is valid
+        best: str = frontier[0][0] if frontier else states[-1]
+        try:
+            while frontier:
+                reached: List[str] = []
+                for _, tree in frontier:
+                    for new_state in self._expand(tree, cancellation):
+                        if new_state not in seen:
+                            seen.add(new_state)
+                            reached.append(new_state)
+                frontier = self._parsed(reached)
+                if frontier:
+                    best = min(best, frontier[0][0], key=_length)
+        except OperationCancelled:
+            cancellation.stopped_early = True
+        finally:
+            self.duration = time.perf_counter() - start
+        return best
+
+    def _parsed(self, states: List[str]) -> List[Tuple[str, NodeNG]]:
+        """Returns the `width` shortest states which can be parsed, shortest first, with their trees."""
+        parsed: List[Tuple[str, NodeNG]] = []
+        for state in sorted(states, key=_length):
+            if len(parsed) == self.width:
+                break
+            try:
+                parsed.append((state, self.backend.parse(state)))
+            except AstroidSyntaxError:
+                pass
+        return parsed
+
+    def _expand(self, tree: NodeNG, cancellation: CancellationToken) -> Iterator[str]:
+        index: NodeIndex = NodeIndex(tree, cancellation)
+        steps: List[List[AstroidRule]] = self._steps(tree, index, cancellation)
+        for i, rules in enumerate(steps):
+            # The rules of a step transform the tree in place, the steps but the last one transform copies of the tree
+            if i < len(steps) - 1:
+                step_index: NodeIndex = index.copy(cancellation)
+            else:
+                step_index = index
+            registry: RuleRegistry = RuleRegistry(cancellation, step_index)
+            for rule in rules:
+                registry.register_rule(rule)
+            self.explored += 1
+            yield Unparser(cancellation=cancellation).unparse(registry.visit(step_index.tree))
+
+    def _steps(self, tree: NodeNG, index: NodeIndex, cancellation: CancellationToken) -> List[List[AstroidRule]]:
+        steps: List[List[AstroidRule]] = []
+        for phase in self.phases:
+            rules: List[AstroidRule] = list(phase.generate_rules(tree, cancellation, index))
+            if rules:
+                steps.append(rules)
+            if phase.independent_rules and len(rules) > 1:
+                steps.extend([rule] for rule in rules)
+        return steps
+
+
+def _length(code: str) -> Tuple[int, str]:
+    return len(code), code
@@ -0,0 +1,8 @@
+from typing import List
+
+from .cache_backend import CacheBackend
+from .cache_key import cache_key, code_version
+from .lru_cache import LRUCache
+from .sqlite_cache import SQLiteCache, default_cache_path
+
+__all__: List[str] = ["cache_key", "CacheBackend", "code_version", "default_cache_path", "LRUCache", "SQLiteCache"]
@@ -0,0 +1,18 @@
+import abc
+from typing import Optional
+
+
+class CacheBackend(metaclass=abc.ABCMeta):
+    """Storage of shortened codes, addressed by the keys of `pygolf.cache.cache_key`."""
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def put(self, key: str, value: str) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
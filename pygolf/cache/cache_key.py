@@ -0,0 +1,35 @@
+import functools
+import hashlib
+import os
+
+import pygolf
+
+
+@functools.lru_cache(maxsize=None)
+def _sources_digest() -> str:
+    # The rules change the output without changing the version number, their sources are part of the keys
+    digest = hashlib.sha256()
+    package_path: str = os.path.dirname(os.path.abspath(pygolf.__file__))
+    for directory, directories, files in os.walk(package_path):
+        directories.sort()
+        for file in sorted(files):
+            if file.endswith(".py"):
+                path: str = os.path.join(directory, file)
+                digest.update(os.path.relpath(path, package_path).encode("utf-8"))
+                with open(path, "rb") as fp:
+                    digest.update(fp.read())
+    return digest.hexdigest()
+
+
+def code_version() -> str:
+    """Version of the pygolf code shortening the codes: its version number, and a digest of its sources."""
+    return f"{pygolf.__version__}+{_sources_digest()}"
+
+
+def cache_key(code: str, configuration: str) -> str:
+    """Content address of the shortened `code`, which changes with the pygolf code and its `configuration`."""
+    digest = hashlib.sha256()
+    for part in (code_version(), configuration, code):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
@@ -0,0 +1,68 @@
+import threading
+from collections import OrderedDict
+from typing import *
+
+from .cache_backend import CacheBackend
+
+
+class LRUCache(CacheBackend):
+    """In-memory cache of shortened codes, evicting the least recently used entries.
+
+    The cache holds at most `max_entries` entries and `max_bytes` bytes of keys and values, a limit set to `None` is
+    not enforced.
+    """
+
+    def __init__(self, max_entries: Optional[int] = 1024, max_bytes: Optional[int] = None) -> None:
+        self.max_entries: Optional[int] = max_entries
+        self.max_bytes: Optional[int] = max_bytes
+        self.entries: "OrderedDict[str, str]" = OrderedDict()
+        self.size: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.lock: threading.Lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        with self.lock:
+            if key in self.entries:
+                self.size -= self._entry_size(key, self.entries.pop(key))
+            self.entries[key] = value
+            self.size += self._entry_size(key, value)
+            while self.entries and self._is_full():
+                evicted_key, evicted_value = self.entries.popitem(last=False)
+                self.size -= self._entry_size(evicted_key, evicted_value)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getstate__(self) -> Dict[str, Optional[int]]:
+        # Copies sent to other processes start empty, entries and locks are not shared between processes.
+        return {"max_entries": self.max_entries, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state: Dict[str, Optional[int]]) -> None:
+        self.__init__(state["max_entries"], state["max_bytes"])  # type: ignore
+
+    def _is_full(self) -> bool:
+        return (self.max_entries is not None and len(self.entries) > self.max_entries) or (
+            self.max_bytes is not None and self.size > self.max_bytes
+        )
+
+    @staticmethod
+    def _entry_size(key: str, value: str) -> int:
+        return len(key.encode("utf-8")) + len(value.encode("utf-8"))
@@ -0,0 +1,147 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import *
+
+from .cache_backend import CacheBackend
+from .cache_key import code_version
+
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE TABLE IF NOT EXISTS metadata (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+INSERT OR IGNORE INTO metadata VALUES ('version', ''), ('entries', '0'), ('bytes', '0');
+"""
+
+
+def default_cache_path() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "pygolf", "cache.sqlite3")
+
+
+class SQLiteCache(CacheBackend):
+    """Cache of shortened codes stored in a SQLite database, shared by every process opening the same `path`.
+
+    The least recently used entries are evicted beyond `max_entries` entries or `max_bytes` bytes of keys and values.
+    Entries written by another pygolf version, or by other pygolf sources, are dropped when the database is opened,
+    entries of another phase set are never read again since the configuration is part of the keys, and end up evicted.
+    """
+
+    def __init__(self, path: str, max_entries: Optional[int] = 100_000, max_bytes: Optional[int] = None) -> None:
+        self.path: str = path
+        self.max_entries: Optional[int] = max_entries
+        self.max_bytes: Optional[int] = max_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._local: threading.local = threading.local()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._transaction() as connection:
+            row = connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        self.hits += 1
+        return cast(str, row[0])
+
+    def put(self, key: str, value: str) -> None:
+        size = len(key.encode("utf-8")) + len(value.encode("utf-8"))
+        with self._transaction() as connection:
+            self._delete(connection, [key])
+            connection.execute("INSERT INTO entries VALUES (?, ?, ?, ?)", (key, value, size, time.time()))
+            self._add_to_totals(connection, 1, size)
+            self._evict(connection)
+
+    def clear(self) -> None:
+        with self._transaction() as connection:
+            self._clear(connection)
+
+    def __len__(self) -> int:
+        with self._transaction() as connection:
+            return self._totals(connection)[0]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Connections can not be shared with other processes, copies open their own.
+        return {"path": self.path, "max_entries": self.max_entries, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["path"], state["max_entries"], state["max_bytes"])  # type: ignore
+
+    def _transaction(self) -> sqlite3.Connection:
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = self._connect()
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        connection.execute("BEGIN IMMEDIATE")
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Transactions are handled explicitly, they take the write lock immediately to avoid deadlocks between
+        # processes upgrading their read lock, other processes wait up to `timeout` seconds for the lock.
+        connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.executescript(_SCHEMA)
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            (version,) = connection.execute("SELECT value FROM metadata WHERE name = 'version'").fetchone()
+            if version != code_version():
+                self._clear(connection)
+                connection.execute("UPDATE metadata SET value = ? WHERE name = 'version'", (code_version(),))
+        return connection
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        entries, size = self._totals(connection)
+        while entries and self._is_full(entries, size):
+            rows = connection.execute("SELECT key, size FROM entries ORDER BY accessed LIMIT 64").fetchall()
+            evicted: List[str] = []
+            for key, entry_size in rows:
+                if not self._is_full(entries, size):
+                    break
+                evicted.append(key)
+                entries -= 1
+                size -= entry_size
+            self._delete(connection, evicted)
+            self.evictions += len(evicted)
+
+    def _is_full(self, entries: int, size: int) -> bool:
+        return (self.max_entries is not None and entries > self.max_entries) or (
+            self.max_bytes is not None and size > self.max_bytes
+        )
+
+    def _delete(self, connection: sqlite3.Connection, keys: List[str]) -> None:
+        for key in keys:
+            row = connection.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._add_to_totals(connection, -1, -row[0])
+
+    def _clear(self, connection: sqlite3.Connection) -> None:
+        connection.execute("DELETE FROM entries")
+        connection.execute("UPDATE metadata SET value = '0' WHERE name IN ('entries', 'bytes')")
+
+    @staticmethod
+    def _totals(connection: sqlite3.Connection) -> Tuple[int, int]:
+        totals = dict(connection.execute("SELECT name, value FROM metadata WHERE name IN ('entries', 'bytes')"))
+        return int(totals["entries"]), int(totals["bytes"])
+
+    @staticmethod
+    def _add_to_totals(connection: sqlite3.Connection, entries: int, size: int) -> None:
+        connection.execute("UPDATE metadata SET value = value + ? WHERE name = 'entries'", (entries,))
+        connection.execute("UPDATE metadata SET value = value + ? WHERE name = 'bytes'", (size,))
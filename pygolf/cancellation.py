@@ -0,0 +1,54 @@
+import time
+from typing import *
+
+from pygolf.errors.operation_cancelled import OperationCancelled
+
+
+class CancellationToken:
+    """Cooperative cancellation of a shortening.
+
+    Long running steps call `check` regularly, which raises `OperationCancelled` once the token is cancelled.
+    `stopped_early` is set when a shortening returned a partial result because of the token.
+    """
+
+    def __init__(self) -> None:
+        self.cancelled: bool = False
+        self.stopped_early: bool = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self.cancelled
+
+    def check(self) -> None:
+        if self.is_cancelled():
+            raise OperationCancelled
+
+    @staticmethod
+    def any(tokens: Sequence["CancellationToken"]) -> "CancellationToken":
+        return tokens[0] if len(tokens) == 1 else _AnyCancellationToken(tokens)
+
+
+class Deadline(CancellationToken):
+    """Token cancelled once `time.monotonic()` reaches `deadline`."""
+
+    def __init__(self, deadline: float) -> None:
+        super().__init__()
+        self.deadline: float = deadline
+
+    @staticmethod
+    def after(seconds: float) -> "Deadline":
+        return Deadline(time.monotonic() + seconds)
+
+    def is_cancelled(self) -> bool:
+        return self.cancelled or time.monotonic() >= self.deadline
+
+
+class _AnyCancellationToken(CancellationToken):
+    def __init__(self, tokens: Sequence[CancellationToken]) -> None:
+        super().__init__()
+        self.tokens: Sequence[CancellationToken] = tokens
+
+    def is_cancelled(self) -> bool:
+        return self.cancelled or any(token.is_cancelled() for token in self.tokens)
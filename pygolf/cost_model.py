@@ -0,0 +1,95 @@
+from typing import *
+
+from astroid.node_classes import NodeNG
+
+from pygolf.cancellation import CancellationToken
+from pygolf.helper.node_index import NodeIndex
+from pygolf.rules import AstroidRule, Version
+from pygolf.unparser import Unparser
+
+
+def rename_gain(name: str, new_name: str, occurrences: int = 1) -> int:
+    """Returns the number of characters saved by renaming the `occurrences` of the identifier `name` to `new_name`."""
+    return (len(name) - len(new_name)) * occurrences
+
+
+def alias_gain(name: str, alias: str, references: int) -> int:
+    """Returns the number of characters saved by defining `alias=name` and using `alias` for the `references` of `name`.
+
+    The definition is a statement of its own, which costs its separator from the next statement too.
+    """
+    return rename_gain(name, alias, references) - len(f"{alias}={name}") - 1
+
+
+class CostModel:
+    """Characters saved by the rewrites of a tree, measured on the tree as it is, without rewriting it.
+
+    The lengths of the subtrees are measured by a single `Unparser`, which caches them:
+    the tree must not be modified while the model is used.
+    """
+
+    def __init__(self, cancellation: Optional[CancellationToken] = None) -> None:
+        self.unparser: Unparser = Unparser(cancellation=cancellation)
+
+    def length(self, node: NodeNG, indent: int = 0) -> int:
+        """Returns the length of the code of `node`."""
+        return self.unparser.unparse_length(node, indent)
+
+    def rule_gain(self, rule: AstroidRule, index: NodeIndex) -> int:
+        """Returns the number of characters saved by applying `rule` to the nodes of the tree of `index`."""
+        node_classes: Any = rule.on_node if isinstance(rule.on_node, tuple) else (rule.on_node,)
+        rule.index = index
+        gain: int = 0
+        for node_class in node_classes:
+            for node in index.nodes_of_class(node_class):
+                if rule.predicate(node):
+                    gain += rule.gain(node, self)
+        return gain
+
+    def profitable_rules(self, rules: Iterable[AstroidRule], index: NodeIndex) -> Iterator[AstroidRule]:
+        """Yields the rules of `rules` which save characters when applied to the tree of `index`.
+
+        The rules are yielded restricted to the nodes on which they save characters.
+        """
+        for rule in rules:
+            if self.rule_gain(rule, index) > 0:
+                yield ProfitableRule(rule, self)
+
+
+class ProfitableRule(AstroidRule):
+    """`rule` restricted to the nodes on which it saves characters, as measured by `cost_model`.
+
+    The rule is applied while the tree is transformed, so the lengths cached by the model are cleared
+    before measuring each node.
+    """
+
+    def __init__(self, rule: AstroidRule, cost_model: CostModel) -> None:
+        self.rule: AstroidRule = rule
+        self.cost_model: CostModel = cost_model
+        self.on_node = rule.on_node
+
+    def transform(self, node: NodeNG) -> NodeNG:
+        return self.rule.transform(node)
+
+    def predicate(self, node: NodeNG) -> bool:
+        if not self.rule.predicate(node):
+            return False
+        self.cost_model.unparser.lengths.clear()
+        return self.rule.gain(node, self.cost_model) > 0
+
+    def gain(self, node: NodeNG, cost_model: CostModel) -> int:
+        return self.rule.gain(node, cost_model)
+
+    def since(self) -> Version:
+        return self.rule.since()
+
+    @property
+    def index(self) -> Optional[NodeIndex]:
+        return self.rule.index
+
+    @index.setter
+    def index(self, index: Optional[NodeIndex]) -> None:
+        self.rule.index = index
+
+    def __repr__(self) -> str:
+        return repr(self.rule)
@@ -0,0 +1,3 @@
+class OperationCancelled(Exception):
+    def __init__(self):
+        super().__init__("Operation cancelled before its end")
@@ -0,0 +1,4 @@
+class ShortenFailure(Exception):
+    def __init__(self, reason: str):
+        super().__init__(f"Code could not be shortened: {reason}")
+        self.reason: str = reason
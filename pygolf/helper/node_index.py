@@ -0,0 +1,76 @@
+from collections import defaultdict
+from typing import *
+
+import astroid as ast
+from astroid.node_classes import NodeNG
+
+from pygolf.cancellation import CancellationToken
+from pygolf.helper import walker
+
+
+class NodeIndex:
+    """Nodes of a tree by class, and `Name` and `AssignName` nodes by identifier, built in a single walk of the tree.
+
+    The index is a snapshot of the tree when it is built: the nodes created by later transforms are not in it,
+    and the nodes they replace still are, in the subtrees they were in.
+    """
+
+    def __init__(self, tree: NodeNG, cancellation: Optional[CancellationToken] = None) -> None:
+        self.tree: NodeNG = tree
+        self.nodes: Dict[type, List[NodeNG]] = defaultdict(list)
+        self.names: Dict[str, List[NodeNG]] = defaultdict(list)
+        # Positions of the nodes in the walk, and the positions following their subtrees, by id of node
+        self._spans: Dict[int, Tuple[int, int]] = {}
+
+        # Nodes to walk, and the nodes which subtrees are being walked, with their positions
+        stack: List[Any] = [tree]
+        position: int = 0
+        while stack:
+            node: Any = stack.pop()
+            if node.__class__ is tuple:
+                node, start = node
+                self._spans[id(node)] = (start, position)
+                continue
+
+            if cancellation is not None:
+                cancellation.check()
+            self.nodes[node.__class__].append(node)
+            if node.__class__ is ast.Name or node.__class__ is ast.AssignName:
+                self.names[node.name].append(node)
+            stack.append((node, position))
+            position += 1
+            walker.push_children(stack, node)
+
+    def copy(self, cancellation: Optional[CancellationToken] = None) -> "NodeIndex":
+        """Returns the index of a copy of the tree, built from this index without walking the copy.
+
+        The rules may transform the copy while the tree and this index stay unchanged.
+        The tree must not have been transformed since this index was built.
+        """
+        copies: Dict[int, NodeNG] = walker.copy_tree(self.tree, cancellation)
+        index: NodeIndex = NodeIndex.__new__(NodeIndex)
+        index.tree = copies[id(self.tree)]
+        index.nodes = defaultdict(
+            list, {node_class: [copies[id(node)] for node in nodes] for node_class, nodes in self.nodes.items()}
+        )
+        index.names = defaultdict(list, {name: [copies[id(node)] for node in nodes] for name, nodes in self.names.items()})
+        index._spans = {id(copies[node_id]): span for node_id, span in self._spans.items()}
+        return index
+
+    def __contains__(self, node: NodeNG) -> bool:
+        return id(node) in self._spans
+
+    def nodes_of_class(self, node_class: type) -> List[NodeNG]:
+        """Returns the nodes of class `node_class`, not of its subclasses, in the order of the code."""
+        return self.nodes.get(node_class, [])
+
+    def occurrences(self, name: str, inside: Optional[NodeNG] = None) -> List[NodeNG]:
+        """Returns the `Name` and `AssignName` nodes of the identifier `name`.
+
+        Only the ones in the subtree of `inside` are returned if it is given.
+        """
+        occurrences: List[NodeNG] = self.names.get(name, [])
+        if inside is None:
+            return occurrences
+        start, end = self._spans[id(inside)]
+        return [occurrence for occurrence in occurrences if start <= self._spans[id(occurrence)][0] < end]
@@ -0,0 +1,141 @@
+import signal
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import *
+
+from astroid import AstroidSyntaxError
+
+from pygolf.errors.shorten_failure import ShortenFailure
+
+if TYPE_CHECKING:
+    from pygolf.pygolfer import Pygolfer  # noqa: F401
+
+BatchResult = Union[Optional[str], ShortenFailure]
+
+_SHORTENED: str = "shortened"
+_FAILED: str = "failed"
+
+# Whether the handler of the timer signal is installed in the process
+_handles_timeout: bool = False
+
+
+class _Timeout(Exception):
+    pass
+
+
+def chunks(codes: Iterable[str], chunksize: int) -> Iterator[List[str]]:
+    iterator = iter(codes)
+    chunk = list(islice(iterator, chunksize))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunksize))
+
+
+def _handle_timeout() -> None:
+    global _handles_timeout
+    if not _handles_timeout and hasattr(signal, "setitimer"):
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        _handles_timeout = True
+
+
+def _raise_timeout(signal_number: int, frame: Any) -> None:
+    raise _Timeout
+
+
+def _set_timer(timeout: Optional[float], seconds: float) -> None:
+    if timeout is not None and hasattr(signal, "setitimer"):
+        signal.setitimer(signal.ITIMER_REAL, seconds)
+
+
+def _shorten_item(pygolfer: "Pygolfer", code: str, timeout: Optional[float]) -> Tuple[str, Optional[str]]:
+    if timeout is not None:
+        _handle_timeout()
+    try:
+        _set_timer(timeout, timeout or 0)
+        try:
+            return _SHORTENED, pygolfer.shorten(code)
+        finally:
+            _set_timer(timeout, 0)
+    except AstroidSyntaxError:
+        return _SHORTENED, None
+    except _Timeout:
+        return _FAILED, f"timed out after {timeout} seconds"
+    except Exception as error:
+        return _FAILED, f"{error.__class__.__name__}: {error}"
+
+
+def _shorten_chunk(pygolfer: "Pygolfer", codes: List[str], timeout: Optional[float]) -> List[Tuple[str, Optional[str]]]:
+    return [_shorten_item(pygolfer, code, timeout) for code in codes]
+
+
+class ProcessBatch:
+    """Shortens chunks of codes on a pool of processes and yields the results in submission order.
+
+    When a worker crashes, the chunks lost with it are shortened again one code at a time,
+    so that only the code which crashed its worker is reported as a failure.
+    The pygolfer is sent with each chunk, which is cheap as the caches are pickled without their entries.
+    """
+
+    def __init__(self, pygolfer: "Pygolfer", workers: int, timeout: Optional[float]) -> None:
+        if timeout is not None and not hasattr(signal, "setitimer"):
+            raise ValueError("timeout is not supported on platforms without signal.setitimer")
+        self.pygolfer: "Pygolfer" = pygolfer
+        self.workers: int = workers
+        self.timeout: Optional[float] = timeout
+        self.executor: ProcessPoolExecutor = self._new_executor()
+        self.pending: Deque[Tuple[List[str], Future]] = deque()
+
+    def submit(self, chunk: List[str]) -> Iterator[BatchResult]:
+        self.pending.append((chunk, self._submit(chunk)))
+        while len(self.pending) > 2 * self.workers:
+            yield from self._pop()
+
+    def drain(self) -> Iterator[BatchResult]:
+        while self.pending:
+            yield from self._pop()
+
+    def shutdown(self) -> None:
+        for _, future in self.pending:
+            future.cancel()
+        self.pending.clear()
+        self.executor.shutdown()
+
+    def _pop(self) -> Iterator[BatchResult]:
+        chunk, future = self.pending.popleft()
+        try:
+            results = future.result()
+        except BrokenProcessPool:
+            results = self._recover(chunk)
+        for status, value in results:
+            if status == _FAILED:
+                yield ShortenFailure(cast(str, value))
+            else:
+                yield value
+
+    def _recover(self, chunk: List[str]) -> List[Tuple[str, Optional[str]]]:
+        # Every pending chunk has been lost with the pool, they are submitted again once the codes
+        # of `chunk` have been shortened alone, so that a crash can be attributed to a single code.
+        self._replace_executor()
+        results = [self._isolate(code) for code in chunk]
+        self.pending = deque((pending_chunk, self._submit(pending_chunk)) for pending_chunk, _ in self.pending)
+        return results
+
+    def _isolate(self, code: str) -> Tuple[str, Optional[str]]:
+        try:
+            return cast(Tuple[str, Optional[str]], self._submit([code]).result()[0])
+        except BrokenProcessPool:
+            self._replace_executor()
+            return _FAILED, "worker process crashed"
+
+    def _replace_executor(self) -> None:
+        self.executor.shutdown(wait=False)
+        self.executor = self._new_executor()
+
+    def _submit(self, chunk: List[str]) -> Future:
+        return self.executor.submit(_shorten_chunk, self.pygolfer, chunk, self.timeout)
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # The initializer of the workers needs python 3.7
+        return ProcessPoolExecutor(max_workers=self.workers)
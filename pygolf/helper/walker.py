@@ -1,25 +1,90 @@
+from typing import *
+
+import astroid as ast
 from astroid.node_classes import NodeNG
 
+from pygolf.cancellation import CancellationToken
+
+
+def walk(
+    node: NodeNG,
+    cancellation: Optional[CancellationToken] = None,
+    only: Optional[Union[type, Tuple[type, ...]]] = None,
+    prune: Optional[Callable[[NodeNG], bool]] = None,
+) -> Iterator[NodeNG]:
+    """Yields `node` and its descendants once each, in the order of the code.
+
+    Only the nodes of the classes `only` are yielded if given,
+    and the descendants of the nodes for which `prune` returns true are not walked.
+    """
+    stack: List[NodeNG] = [node]
+    while stack:
+        node = stack.pop()
+        if cancellation is not None:
+            cancellation.check()
+        if only is None or isinstance(node, only):
+            yield node
+        if prune is None or not prune(node):
+            push_children(stack, node)
+
+
+def push_children(stack: List[Any], node: NodeNG) -> None:
+    """Pushes the children of `node` on `stack`, to be popped in the order of the code."""
+    start: int = len(stack)
+    for name in node._astroid_fields:
+        value: Any = getattr(node, name)
+        if value.__class__ is list:
+            for item in value:
+                if isinstance(item, NodeNG):
+                    stack.append(item)
+                else:
+                    _push_nodes(stack, item)
+        elif value is not None:
+            _push_nodes(stack, value)
+    stack[start:] = reversed(stack[start:])
+
+
+def _push_nodes(stack: List[NodeNG], value: Any) -> None:
+    # Fields hold a node, None, or a list of nodes or of tuples of nodes, like the items of `With` and `Dict`
+    if isinstance(value, NodeNG):
+        stack.append(value)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _push_nodes(stack, item)
+
+
+def copy_tree(tree: NodeNG, cancellation: Optional[CancellationToken] = None) -> Dict[int, NodeNG]:
+    """Copies the nodes of `tree`, and returns the copies by id of the node they copy.
+
+    The children and parents of the copies are copies, their other fields are shared with the nodes of `tree`,
+    like the `locals` of the scopes, which still refer to the nodes of `tree`.
+    """
+    copies: Dict[int, NodeNG] = {}
+    stack: List[NodeNG] = [tree]
+    while stack:
+        node: NodeNG = stack.pop()
+        if cancellation is not None:
+            cancellation.check()
+        copy: NodeNG = object.__new__(node.__class__)
+        copy.__dict__.update(node.__dict__)
+        copies[id(node)] = copy
+        push_children(stack, node)
 
-def walk(node: NodeNG):
-    yield node
-    yield from _visit(node)
+    for copy in copies.values():
+        copy.parent = copies.get(id(copy.parent), copy.parent)
+        for name in copy._astroid_fields:
+            setattr(copy, name, _copied_field(getattr(copy, name), copies))
+    return copies
 
 
-def _visit(node: NodeNG):
-    if hasattr(node, "_astroid_fields"):
-        for name in node._astroid_fields:
-            value = getattr(node, name)
-            yield from _visit_generic(value)
+def _copied_field(value: Any, copies: Dict[int, NodeNG]) -> Any:
+    if isinstance(value, NodeNG):
+        return copies[id(value)]
+    if isinstance(value, (list, tuple)):
+        return value.__class__(_copied_field(item, copies) for item in value)
+    return value
 
 
-def _visit_generic(node: NodeNG):
-    if isinstance(node, list) or isinstance(node, tuple):
-        for child in node:
-            yield child
-            yield from _visit(child)
-    elif not node or isinstance(node, str):
-        pass
-    else:
-        yield node
-    yield from _visit(node)
+def is_expression(node: NodeNG) -> bool:
+    """Returns whether `node` is a part of an expression, which holds no statement: to prune walks looking for statements."""
+    return not node.is_statement and not isinstance(node, ast.Module)
@@ -0,0 +1,187 @@
+import ast as python_ast
+import io
+import tokenize
+from typing import *
+
+import astroid as ast
+from astroid.node_classes import NodeNG
+
+from pygolf.backends import AstroidBackend, ParseBackend
+from pygolf.helper import walker
+from pygolf.helper.node_index import NodeIndex
+from pygolf.optimization_phases import AlwaysApplyPhase, RenamePhase
+from pygolf.optimizers.batch_optimizer import BatchOptimizer
+from pygolf.pygolfer import Pygolfer
+from pygolf.rules import AstroidRule, DefineRenameCall, RenameIdentifiers, RuleRegistry
+from pygolf.unparser import Unparser
+
+
+class _Statement:
+    """Top level statement, with what an `IncrementalPygolfer` reuses while the statement does not change."""
+
+    def __init__(self, source: str, tree: NodeNG, analysis: BatchOptimizer) -> None:
+        self.source: str = source
+        # Module of the statement once the `AlwaysApplyPhase` is applied, consumed by its first rendering
+        self.tree: Optional[NodeNG] = tree
+        self.analysis: BatchOptimizer = analysis
+        self.names: Set[str] = {node.name for node in tree.nodes_of_class((ast.Name, ast.AssignName))}
+        self.is_block: bool = Unparser().has_block(tree.body)
+        self.rules_key: Optional[Tuple[str, ...]] = None
+        self.shortened: str = ""
+        self.aliases: Set[Tuple[str, str]] = set()
+
+
+class IncrementalPygolfer:
+    """Shortens successive versions of a code, processing again only the top level statements which changed.
+
+    Each top level statement is analyzed once, the renamings are then decided from the merged analyses of the
+    statements, and a statement is unparsed again only if the renamings of its names changed.
+    The output is the same as the output of `Pygolfer().shorten`.
+    """
+
+    def __init__(self, backend: Optional[ParseBackend] = None) -> None:
+        self.backend: ParseBackend = AstroidBackend() if backend is None else backend
+        self.always_apply_phase: AlwaysApplyPhase = AlwaysApplyPhase()
+        self.rename_phase: RenamePhase = RenamePhase()
+        self.statements: Dict[str, _Statement] = {}
+
+    def shorten(self, code: str) -> str:
+        sources: Optional[List[str]] = _split_statements(code)
+        if sources is None:
+            return Pygolfer(backend=self.backend).shorten(code)
+
+        statements: Dict[str, _Statement] = {}
+        for source in sources:
+            if source not in statements:
+                statements[source] = self.statements.get(source) or self._analyze(source)
+        self.statements = statements
+        body: List[_Statement] = [statements[source] for source in sources]
+
+        rules: List[AstroidRule] = list(self.rename_phase.generate_merged_rules(statement.analysis for statement in body))
+        statement_rules: List[AstroidRule] = [rule for rule in rules if rule.on_node is not ast.Module]
+        shortened_body: List[str] = [self._render(statement, statement_rules) for statement in body]
+
+        definitions: List[str] = self._render_definitions(
+            [rule for rule in rules if rule.on_node is ast.Module], set().union(*(statement.aliases for statement in body))
+        )
+        separator: str = "\n" if any(statement.is_block for statement in body) else ";"
+        return separator.join(definitions + shortened_body)
+
+    def _analyze(self, source: str) -> _Statement:
+        tree: NodeNG = self._apply_always_apply_phase(source)
+        return _Statement(source, tree, self.rename_phase.analyze(tree))
+
+    def _apply_always_apply_phase(self, source: str) -> NodeNG:
+        tree: NodeNG = self.backend.parse(source)
+        if tree.doc is not None:
+            # A string statement parsed alone is taken as the docstring of its module
+            expr: ast.Expr = ast.Expr(parent=tree)
+            expr.postinit(value=ast.Const(tree.doc, parent=expr))
+            tree.body, tree.doc = [expr], None
+        index: NodeIndex = NodeIndex(tree)
+        registry: RuleRegistry = RuleRegistry(index=index)
+        for rule in self.always_apply_phase.generate_rules(tree, index=index):
+            registry.register_rule(rule)
+        return registry.visit(tree)
+
+    def _render(self, statement: _Statement, rules: List[AstroidRule]) -> str:
+        rules = [rule.restricted_to(statement.names) for rule in rules if isinstance(rule, RenameIdentifiers)]
+        rules_key: Tuple[str, ...] = tuple(map(repr, rules))
+        if rules_key == statement.rules_key:
+            return statement.shortened
+
+        tree: NodeNG = statement.tree if statement.tree is not None else self._apply_always_apply_phase(statement.source)
+        statement.tree = None
+        registry: RuleRegistry = RuleRegistry()
+        for rule in rules:
+            registry.register_rule(rule)
+        tree = registry.visit(tree)
+
+        statement.rules_key = rules_key
+        statement.shortened = Unparser().unparse(tree)
+        statement.aliases = {
+            (target.name, node.value.name)
+            for node in walker.walk(tree, only=ast.Assign, prune=walker.is_expression)
+            if isinstance(node.value, ast.Name)
+            for target in node.targets
+            if hasattr(target, "name")
+        }
+        return statement.shortened
+
+    def _render_definitions(self, rules: List[AstroidRule], aliases: Set[Tuple[str, str]]) -> List[str]:
+        # Module rules insert definitions at the top of the module, they are applied on an empty module,
+        # and `aliases` stands for the walk of the whole module in the predicate of `DefineRenameCall`.
+        module: ast.Module = ast.Module(name="", doc=None)
+        module.postinit(body=[])
+        for rule in rules:
+            assert isinstance(rule, DefineRenameCall)
+            if (rule.new_name, rule.old_name) not in aliases:
+                module = rule.transform(module)
+                aliases.add((rule.new_name, rule.old_name))
+        return list(map(Unparser().unparse, module.body))
+
+
+# Keywords starting a clause continuing a compound statement, and starting a compound statement
+_clause_keywords: Set[str] = {"elif", "else", "except", "finally"}
+_compound_keywords: Set[str] = {"async", "class", "def", "for", "if", "try", "while", "with"} | _clause_keywords
+
+
+def _split_statements(code: str) -> Optional[List[str]]:
+    try:
+        module: python_ast.Module = python_ast.parse(code)
+    except (SyntaxError, ValueError):
+        return None
+    sources: List[str] = list(_statement_sources(code))
+    if python_ast.get_docstring(module, clean=False) is not None:
+        # The docstring of the module is not a statement of its body
+        sources = sources[1:]
+    return sources
+
+
+def _statement_sources(code: str) -> Iterator[str]:
+    """Yields the source of each top level statement of the valid `code`, from its first token to its last one.
+
+    The statements are delimited with the tokens, as the end positions of the nodes of `ast` need python 3.8.
+    """
+    line_offsets: List[int] = [0]
+    for line in io.StringIO(code).readlines():
+        line_offsets.append(line_offsets[-1] + len(line))
+    tokens: List[tokenize.TokenInfo] = [
+        token
+        for token in tokenize.generate_tokens(io.StringIO(code).readline)
+        if token.type not in (tokenize.COMMENT, tokenize.NL)
+    ]
+
+    depth: int = 0
+    start: Optional[int] = None
+    end: int = 0
+    # First token of the current logical line
+    line_start: str = ""
+    for token, next_token in zip(tokens, tokens[1:]):
+        if token.type == tokenize.INDENT:
+            depth += 1
+        elif token.type == tokenize.DEDENT:
+            depth -= 1
+        elif token.type != tokenize.NEWLINE and token.string != ";":
+            start = line_offsets[token.start[0] - 1] + token.start[1] if start is None else start
+            end = line_offsets[token.end[0] - 1] + token.end[1]
+            line_start = line_start or token.string
+            continue
+        if start is not None and depth == 0 and _ends_statement(token, next_token, line_start):
+            yield code[start:end]
+            start = None
+        if token.type == tokenize.NEWLINE:
+            line_start = ""
+
+
+def _ends_statement(token: tokenize.TokenInfo, next_token: tokenize.TokenInfo, line_start: str) -> bool:
+    # Whether the top level statement ends with `token`, a newline, semicolon or dedent at the top level
+    if next_token.type == tokenize.INDENT or (next_token.type == tokenize.NAME and next_token.string in _clause_keywords):
+        return False
+    if token.type == tokenize.NEWLINE:
+        # A decorator line is followed by the rest of the decorated statement
+        return line_start != "@"
+    if token.string == ";":
+        # The statements after the colon of a compound statement are in its body
+        return line_start not in _compound_keywords
+    return True
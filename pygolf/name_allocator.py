@@ -0,0 +1,97 @@
+from collections import defaultdict
+from typing import *
+
+import astroid as ast
+from astroid.node_classes import NodeNG
+
+from pygolf.cost_model import rename_gain
+from pygolf.name_finder import NameFinder
+
+# Scope of an identifier: a function, lambda, class or comprehension, and `None` for the module
+Scope = Optional[NodeNG]
+
+
+def scope_of(node: NodeNG) -> Scope:
+    """Returns the scope in which the name `node` occurs."""
+    scope: Optional[NodeNG] = node.scope()
+    return None if scope is None or isinstance(scope, ast.Module) else scope
+
+
+class NameAllocator:
+    """Gives the names of a `NameFinder` to identifiers, the same name to identifiers which do not interfere.
+
+    Two identifiers interfere when a scope of one of them is, encloses or is nested in a scope of the other,
+    as one of them could then shadow the other. The interference graph is not built: it follows from the scopes,
+    and it is colored greedily by `allocate`, with the shortest name which no interfering identifier was given.
+    The names interfering with identifiers of some scopes still do once other names are given, so the search for
+    a name resumes where the last search for the same scopes stopped, and allocating costs about O(scopes).
+    """
+
+    def __init__(self, name_finder: NameFinder) -> None:
+        self.name_finder: NameFinder = name_finder
+        # Names taken from the name finder, in the order they were given
+        self.names: List[str] = []
+        # Names given to no identifier of the module, which encloses every scope: the only ones which can be given again
+        self._shareable_names: List[str] = []
+        # Position in `_shareable_names` of the first name which may not interfere with the identifiers of some scopes
+        self._first_free_names: Dict[FrozenSet[Scope], int] = {}
+        # Names given to the identifiers of each scope, and of each scope and the scopes nested in it
+        self._scope_names: Dict[Scope, Set[str]] = defaultdict(set)
+        self._nested_names: Dict[Scope, Set[str]] = defaultdict(set)
+        # Scopes enclosing each scope, the innermost first
+        self._enclosing_scopes: Dict[Scope, List[Scope]] = {None: []}
+
+    def allocate(self, identifier: str, scopes: Iterable[Scope]) -> Optional[str]:
+        """Gives a name shorter than `identifier` to the identifier occurring in `scopes`, if there is one."""
+        scopes = list(scopes)
+        # Every name given interferes with the identifiers of the module
+        name: Optional[str] = self._first_free_name(scopes) if None not in scopes else None
+        if name is None:
+            if rename_gain(identifier, self.name_finder.next_name()) <= 0:
+                return None
+            name = self.name_finder.pop_next_name()
+            self.names.append(name)
+            if None not in scopes:
+                self._shareable_names.append(name)
+        elif rename_gain(identifier, name) <= 0:
+            return None
+
+        for scope in scopes:
+            self._scope_names[scope].add(name)
+            for nesting_scope in [scope] + self._enclosing(scope):
+                if name in self._nested_names[nesting_scope]:
+                    # It is in the sets of the scopes enclosing this one too
+                    break
+                self._nested_names[nesting_scope].add(name)
+        return name
+
+    def _first_free_name(self, scopes: List[Scope]) -> Optional[str]:
+        key: FrozenSet[Scope] = frozenset(scopes)
+        position: int = self._first_free_names.get(key, 0)
+        while position < len(self._shareable_names) and self._interferes(self._shareable_names[position], scopes):
+            position += 1
+        self._first_free_names[key] = position
+        return self._shareable_names[position] if position < len(self._shareable_names) else None
+
+    def _interferes(self, name: str, scopes: List[Scope]) -> bool:
+        for scope in scopes:
+            if name in self._nested_names.get(scope, ()):
+                return True
+            for enclosing_scope in self._enclosing(scope):
+                if name in self._scope_names.get(enclosing_scope, ()):
+                    return True
+        return False
+
+    def _enclosing(self, scope: Scope) -> List[Scope]:
+        # Scopes up to the innermost one which enclosing scopes are known
+        uncached: List[Scope] = []
+        while scope not in self._enclosing_scopes:
+            assert scope is not None
+            uncached.append(scope)
+            scope = scope_of(scope.parent) if scope.parent is not None else None
+        enclosing_scopes: List[Scope] = self._enclosing_scopes[scope]
+        for nested_scope in reversed(uncached):
+            enclosing_scopes = [scope] + enclosing_scopes
+            self._enclosing_scopes[nested_scope] = enclosing_scopes
+            scope = nested_scope
+        return enclosing_scopes
@@ -1,32 +1,45 @@
+import builtins
+import itertools
+import keyword
 import string
-from typing import List, Set
+from typing import Iterator, Set
 
-from pygolf.errors.no_names_left import NoNamesLeftException
+# Characters of the names in the order they are given: the first character of a name is a letter
+_first_characters: str = (string.ascii_lowercase + string.ascii_uppercase)[::-1]
+_characters: str = _first_characters + string.digits + "_"
+
+# Names which cannot be given: keywords, and builtins which the code may still use
+_reserved_names: Set[str] = set(keyword.kwlist) | set(dir(builtins))
+
+
+def _candidate_names() -> Iterator[str]:
+    """Yields the identifiers, shortest first, without end."""
+    for length in itertools.count():
+        for first_character in _first_characters:
+            for characters in itertools.product(_characters, repeat=length):
+                yield first_character + "".join(characters)
 
 
 class NameFinder:
+    """Gives new names, shortest first, which are not used by the code.
+
+    The names are generated lazily, so they never run out.
+    """
+
     def __init__(self) -> None:
-        self.names: List[str] = list(string.ascii_lowercase + string.ascii_uppercase)
         self.forbidden_names: Set[str] = set()
+        self._candidates: Iterator[str] = _candidate_names()
+        self._next_name: str = next(self._candidates)
 
     def next_name(self) -> str:
-        self._remove_forbidden_names()
-        if self.names:
-            return self.names[-1]
-        else:
-            raise NoNamesLeftException
+        while self._next_name in self.forbidden_names or self._next_name in _reserved_names:
+            self._next_name = next(self._candidates)
+        return self._next_name
 
     def pop_next_name(self) -> str:
-        self._remove_forbidden_names()
-        if self.names:
-            return self.names.pop()
-        else:
-            raise NoNamesLeftException
-
-    def _remove_forbidden_names(self):
-        while self.names and self.names[-1] in self.forbidden_names:
-            self.names.pop()
+        name: str = self.next_name()
+        self._next_name = next(self._candidates)
+        return name
 
     def remove_used_name(self, name: str) -> None:
-        if len(name) == 1:
-            self.forbidden_names.add(name)
+        self.forbidden_names.add(name)
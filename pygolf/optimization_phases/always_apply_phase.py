@@ -1,15 +1,26 @@
-from typing import Iterator
+from typing import Iterator, List, Optional
 
 from astroid.node_classes import NodeNG
 
+from pygolf.cancellation import CancellationToken
+from pygolf.cost_model import CostModel
+from pygolf.helper.node_index import NodeIndex
 from pygolf.rules import *
 
 from .phase import Phase
 
 
 class AlwaysApplyPhase(Phase):
-    def generate_rules(self, ast: NodeNG) -> Iterator[AstroidRule]:
-        yield FormatToFString()
-        yield RangeForToComprehensionFor()
-        yield ComprehensionForAssignToMapAssign()
-        yield ListAppend()
+    independent_rules = True
+
+    def generate_rules(
+        self, ast: NodeNG, cancellation: Optional[CancellationToken] = None, index: Optional[NodeIndex] = None
+    ) -> Iterator[AstroidRule]:
+        # The rules saving no character on `ast` are not applied
+        rules: List[AstroidRule] = [
+            FormatToFString(),
+            RangeForToComprehensionFor(),
+            ComprehensionForAssignToMapAssign(),
+            ListAppend(),
+        ]
+        yield from CostModel(cancellation).profitable_rules(rules, index or NodeIndex(ast, cancellation))
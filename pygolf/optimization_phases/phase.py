@@ -1,12 +1,23 @@
 import abc
-from typing import Iterator
+from typing import Iterator, Optional
 
 from astroid.node_classes import NodeNG
 
+from pygolf.cancellation import CancellationToken
+from pygolf.helper.node_index import NodeIndex
 from pygolf.rules import AstroidRule
 
 
 class Phase(metaclass=abc.ABCMeta):
+    # Whether each rule of the phase may be applied without the others
+    independent_rules: bool = False
+
     @abc.abstractmethod
-    def generate_rules(self, ast: NodeNG) -> Iterator[AstroidRule]:
+    def generate_rules(
+        self, ast: NodeNG, cancellation: Optional[CancellationToken] = None, index: Optional[NodeIndex] = None
+    ) -> Iterator[AstroidRule]:
+        """Generates the rules to apply to `ast`, which `index` indexes if given."""
         raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return self.__class__.__name__
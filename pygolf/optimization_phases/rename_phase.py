@@ -1,7 +1,9 @@
-from typing import Iterator
+from typing import Iterable, Iterator, Optional
 
 from astroid.node_classes import NodeNG
 
+from pygolf.cancellation import CancellationToken
+from pygolf.helper.node_index import NodeIndex
 from pygolf.name_finder import NameFinder
 from pygolf.optimizers.batch_optimizer import BatchOptimizer
 from pygolf.rules import AstroidRule
@@ -10,8 +12,19 @@ from .phase import Phase
 
 
 class RenamePhase(Phase):
-    def generate_rules(self, ast: NodeNG) -> Iterator[AstroidRule]:
-        name_finder = NameFinder()
-        optimizer = BatchOptimizer(name_finder)
-        optimizer.visit(ast)
+    def generate_rules(
+        self, ast: NodeNG, cancellation: Optional[CancellationToken] = None, index: Optional[NodeIndex] = None
+    ) -> Iterator[AstroidRule]:
+        yield from self.analyze(ast, cancellation).generate_optimizations_rules()
+
+    def analyze(self, ast: NodeNG, cancellation: Optional[CancellationToken] = None) -> BatchOptimizer:
+        optimizer = BatchOptimizer(NameFinder())
+        optimizer.visit(ast, cancellation)
+        return optimizer
+
+    def generate_merged_rules(self, analyses: Iterable[BatchOptimizer]) -> Iterator[AstroidRule]:
+        """Generates the rules of a tree from the analyses of its parts, in the order of the tree."""
+        optimizer = BatchOptimizer(NameFinder())
+        for analysis in analyses:
+            optimizer.merge(analysis)
         yield from optimizer.generate_optimizations_rules()
@@ -1,29 +1,61 @@
+import heapq
 from typing import *
 
 import astroid as ast
 
+from pygolf.name_allocator import NameAllocator, Scope, scope_of
 from pygolf.name_finder import NameFinder
 from pygolf.optimizers.optimizer import Optimizer
-from pygolf.rules import AstroidRule, RenameAssignName, RenameName
+from pygolf.rules import AstroidRule, RenameIdentifiers
 
 
 class AssignNameOptimizer(Optimizer):
     def __init__(self, name_finder: NameFinder) -> None:
-        self.names: List[str] = []
+        # Occurrences of the identifiers, assigned or loaded, in the order they are first seen
+        self.names: Counter[str] = Counter()
+        self.assigned_names: Set[str] = set()
+        # Scopes in which the identifiers occur
+        self.scopes: Dict[str, Set[Scope]] = {}
         self.name_finder: NameFinder = name_finder
 
-    def add_name(self, name: str) -> None:
-        self.names.append(name)
+    def add_name(self, name: str, scope: Scope = None) -> None:
+        self.add_loaded_name(name, scope)
+        self.assigned_names.add(name)
+
+    def add_loaded_name(self, name: str, scope: Scope = None) -> None:
+        self.names[name] += 1
+        self.scopes.setdefault(name, set()).add(scope)
+
+    def merge(self, other: Optimizer) -> None:
+        assert isinstance(other, AssignNameOptimizer)
+        self.names.update(other.names)
+        self.assigned_names.update(other.assigned_names)
+        for name, scopes in other.scopes.items():
+            self.scopes.setdefault(name, set()).update(scopes)
 
     def generate_rules(self) -> Iterator[AstroidRule]:
         for name in self.names:
             self.name_finder.remove_used_name(name)
-        for name in self.names:
-            next_name: str = self.name_finder.next_name()
-            if len(next_name) < len(name):
-                self.name_finder.pop_next_name()
-                yield RenameAssignName(name, next_name)
-                yield RenameName(name, next_name)
+        # The most used identifiers are given the shortest names first, the first seen first among equals,
+        # and identifiers of scopes which do not nest each other may be given the same name
+        heap: List[Tuple[int, int, str]] = [
+            (-count, position, name)
+            for position, (name, count) in enumerate(self.names.items())
+            if name in self.assigned_names
+        ]
+        heapq.heapify(heap)
+        allocator: NameAllocator = NameAllocator(self.name_finder)
+        renames: Dict[str, str] = {}
+        while heap:
+            identifier: str = heapq.heappop(heap)[2]
+            new_name: Optional[str] = allocator.allocate(identifier, self.scopes[identifier])
+            if new_name is not None:
+                renames[identifier] = new_name
+        if renames:
+            yield RenameIdentifiers(renames)
 
     def visit_AssignName(self, node: ast.AssignName) -> None:
-        self.add_name(node.name)
+        self.add_name(node.name, scope_of(node))
+
+    def visit_Name(self, node: ast.Name) -> None:
+        self.add_loaded_name(node.name, scope_of(node))
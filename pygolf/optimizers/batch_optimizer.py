@@ -2,6 +2,7 @@ from typing import *
 
 from astroid.node_classes import NodeNG
 
+from pygolf.cancellation import CancellationToken
 from pygolf.helper import walker
 from pygolf.name_finder import NameFinder
 from pygolf.rules import AstroidRule
@@ -14,16 +15,27 @@ from .rename_method_optimizer import RenameMethodOptimizer
 class BatchOptimizer:
     def __init__(self, name_finder: NameFinder):
         self.name_finder: NameFinder = name_finder
-        self.optimizers: List[Optimizer] = [
-            AssignNameOptimizer(name_finder),
-            RenameMethodOptimizer(name_finder),
-        ]
+        self.optimizers: List[Optimizer] = []
+        # Visitors of the optimizers by class of the nodes they visit, the nodes of other classes are not visited
+        self.routes: Dict[type, List[Callable[[NodeNG], None]]] = {}
+        self.add_optimizer(AssignNameOptimizer(name_finder))
+        self.add_optimizer(RenameMethodOptimizer(name_finder))
+
+    def add_optimizer(self, optimizer: Optimizer) -> None:
+        self.optimizers.append(optimizer)
+        for node_class, visitor in optimizer.visitors().items():
+            self.routes.setdefault(node_class, []).append(visitor)
 
     def generate_optimizations_rules(self) -> Iterator[AstroidRule]:
         for optimizer in self.optimizers:
             yield from optimizer.generate_rules()
 
-    def visit(self, node: NodeNG) -> None:
-        for child in walker.walk(node):
-            for optimizer in self.optimizers:
-                optimizer.visit(child)
+    def merge(self, other: "BatchOptimizer") -> None:
+        for optimizer, other_optimizer in zip(self.optimizers, other.optimizers):
+            optimizer.merge(other_optimizer)
+
+    def visit(self, node: NodeNG, cancellation: Optional[CancellationToken] = None) -> None:
+        routes: Dict[type, List[Callable[[NodeNG], None]]] = self.routes
+        for child in walker.walk(node, cancellation, only=tuple(routes)):
+            for visitor in routes.get(child.__class__, ()):
+                visitor(child)
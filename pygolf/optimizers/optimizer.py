@@ -1,14 +1,37 @@
 import abc
-from typing import Iterator
+from typing import Any, Callable, Dict, Iterator
 
+import astroid as ast
 from astroid.node_classes import NodeNG
 
 
 class Optimizer(metaclass=abc.ABCMeta):
+    # Visitors of the node classes, built once per class from its `visit_X` methods
+    _visitors: Dict[type, Callable[[Any, NodeNG], None]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._visitors = {}
+        for visitor_name in dir(cls):
+            if visitor_name.startswith("visit_"):
+                # Helpers named like visitors, after no node class, are not visitors
+                node_class = getattr(ast, visitor_name.replace("visit_", "", 1), None)
+                if isinstance(node_class, type):
+                    cls._visitors[node_class] = getattr(cls, visitor_name)
+
+    def visitors(self) -> Dict[type, Callable[[NodeNG], None]]:
+        """Returns the visitors of `self` by class of the nodes they visit, the classes of the nodes it consumes."""
+        return {node_class: visitor.__get__(self) for node_class, visitor in self._visitors.items()}
+
     def visit(self, node: NodeNG):
-        if hasattr(self, f"visit_{node.__class__.__name__}"):
-            method = getattr(self, f"visit_{node.__class__.__name__}")
-            method(node)
+        visitor = self._visitors.get(node.__class__)
+        if visitor is not None:
+            visitor(self, node)
+
+    @abc.abstractmethod
+    def merge(self, other: "Optimizer") -> None:
+        """Adds the nodes visited by `other`, an optimizer of the same class, as if they were visited by `self`."""
+        raise NotImplementedError
 
     @abc.abstractmethod
     def generate_rules(self) -> Iterator:
@@ -1,41 +1,105 @@
+import builtins
+import heapq
 from typing import *
 
 import astroid as ast
+from astroid.node_classes import NodeNG
 
+from pygolf.cost_model import alias_gain
 from pygolf.name_finder import NameFinder
 from pygolf.optimizers.optimizer import Optimizer
 from pygolf.rules import *
 
-_builtin_methods = __builtins__.keys()  # type: ignore
+_builtin_methods: FrozenSet[str] = frozenset(name for name in dir(builtins) if name.islower())
 
 
 class RenameMethodOptimizer(Optimizer):
     def __init__(self, name_finder: NameFinder) -> None:
-        self.standard_methods: Dict[str, int] = {f: 0 for f in _builtin_methods if f.islower()}
+        # References to the builtins, called or not, in the order they are first seen
+        self.standard_methods: Counter[str] = Counter()
+        # Builtins which the code assigns, defines or imports, and so may not refer to the builtins
+        self.assigned_methods: Set[str] = set()
         self.name_finder: NameFinder = name_finder
 
     def add_name(self, name: str) -> None:
-        if name in self.standard_methods:
+        if name in _builtin_methods:
             self.standard_methods[name] += 1
 
-    def generate_rules(self) -> Iterator[AstroidRule]:
+    def add_assigned_name(self, name: str) -> None:
+        if name in _builtin_methods:
+            self.assigned_methods.add(name)
+
+    def merge(self, other: Optimizer) -> None:
+        assert isinstance(other, RenameMethodOptimizer)
+        self.standard_methods.update(other.standard_methods)
+        self.assigned_methods.update(other.assigned_methods)
 
-        for method, count in self.standard_methods.items():
+    def generate_rules(self) -> Iterator[AstroidRule]:
+        # The builtins which would gain the most from a single character name are renamed first
+        heap: List[Tuple[int, int, str]] = [
+            (-alias_gain(method, "_", count), position, method)
+            for position, (method, count) in enumerate(self.standard_methods.items())
+            if method not in self.assigned_methods
+        ]
+        heapq.heapify(heap)
+        renames: Dict[str, str] = {}
+        while heap:
+            method: str = heapq.heappop(heap)[2]
+            count: int = self.standard_methods[method]
             next_name: str = self.name_finder.next_name()
+            if alias_gain(method, next_name, count) > 0:
+                self.name_finder.pop_next_name()
+                renames[method] = next_name
 
-            length_not_renamed: int = len(method) * count
+        if renames:
+            yield RenameIdentifiers(renames)
+        for method, next_name in renames.items():
+            yield DefineRenameCall(method, next_name)
 
-            length_renamed: int = len(next_name) * count + len(f"{next_name}={method}")
+    def visit_Name(self, node: ast.Name) -> None:
+        if node.name in _builtin_methods and not _is_annotation(node):
+            self.add_name(node.name)
 
-            if length_renamed < length_not_renamed:
-                self.name_finder.pop_next_name()
-                yield RenameCall(method, next_name)
+    def visit_AssignName(self, node: ast.AssignName) -> None:
+        self.add_assigned_name(node.name)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.add_assigned_name(node.name)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self.add_assigned_name(node.name)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.add_assigned_name(node.name)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for name, alias in node.names:
+            # `import a.b` binds `a`
+            self.add_assigned_name(alias or name.split(".")[0])
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        for name, alias in node.names:
+            self.add_assigned_name(alias or name)
 
-                yield DefineRenameCall(method, next_name)
 
-    def visit_Call(self, node: ast.Call) -> None:
-        if isinstance(node.func, ast.Name):
-            self.add_name(node.func.name)
+def _is_annotation(node: ast.Name) -> bool:
+    """Returns whether `node` is part of the annotation of an argument, a return or an assignment, which are not unparsed."""
+    child: NodeNG = node
+    parent: Optional[NodeNG] = node.parent
+    while parent is not None and not parent.is_statement and not isinstance(parent, ast.Arguments):
+        child, parent = parent, parent.parent
+    if isinstance(parent, ast.Arguments):
+        annotations: List[Optional[NodeNG]] = [
+            *parent.annotations,
+            *parent.posonlyargs_annotations,
+            *parent.kwonlyargs_annotations,
+            parent.varargannotation,
+            parent.kwargannotation,
+        ]
+        return any(child is annotation for annotation in annotations)
+    if isinstance(parent, ast.AnnAssign):
+        return child is parent.annotation
+    return isinstance(parent, ast.FunctionDef) and child is parent.returns
 
 
 if __name__ == "__main__":
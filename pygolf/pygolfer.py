@@ -1,26 +1,124 @@
-from typing import List
+import os
+from typing import *
 
-import astroid as ast
 from astroid.node_classes import NodeNG
 
-from pygolf.optimization_phases import all_phases
-from pygolf.rules import AstroidRule
+from pygolf.backends import AstroidBackend, ParseBackend
+from pygolf.cache import CacheBackend, cache_key
+from pygolf.cancellation import CancellationToken, Deadline
+from pygolf.errors.operation_cancelled import OperationCancelled
+from pygolf.helper.node_index import NodeIndex
+from pygolf.helper.process_batch import BatchResult, ProcessBatch, chunks
+from pygolf.optimization_phases import Phase, all_phases
+from pygolf.rules import RuleRegistry
 from pygolf.unparser import Unparser
 
 
 class Pygolfer:
-    def shorten(self, code: str) -> str:
-        module: NodeNG = ast.parse(code)
-        unparser: Unparser = Unparser(should_remove_spaces_between_keywords=False)
-        rules: List[AstroidRule] = []
-
-        for phase in all_phases:
-            for rule in phase.generate_rules(module):
-                ast.MANAGER.register_transform(rule.on_node, rule.transform, rule.predicate)
-                rules.append(rule)
-            module = ast.parse(unparser.unparse(module))
-
-        for rule in rules:
-            ast.MANAGER.unregister_transform(rule.on_node, rule.transform, rule.predicate)
-        unparser.should_remove_spaces_between_keywords = True
-        return unparser.unparse(module)
+    def __init__(
+        self,
+        phases: Optional[List[Phase]] = None,
+        cache: Optional[CacheBackend] = None,
+        backend: Optional[ParseBackend] = None,
+    ) -> None:
+        self.phases: List[Phase] = all_phases if phases is None else phases
+        self.cache: Optional[CacheBackend] = cache
+        self.backend: ParseBackend = AstroidBackend() if backend is None else backend
+
+    def shorten(
+        self,
+        code: str,
+        backend: Optional[ParseBackend] = None,
+        deadline: Optional[Deadline] = None,
+        cancellation: Optional[CancellationToken] = None,
+    ) -> str:
+        """Shortens `code`, parsing it with `backend` instead of the backend of the pygolfer if given.
+
+        If `deadline` is reached or `cancellation` is cancelled before the end, the output of the last completed phase
+        is returned, or `code` unchanged if no phase completed, and `stopped_early` is set on the given tokens.
+        """
+        backend = self.backend if backend is None else backend
+        tokens: List[CancellationToken] = [token for token in (deadline, cancellation) if token is not None]
+        if self.cache is None:
+            return self._shorten_until_cancelled(code, backend, tokens)
+
+        key: str = cache_key(code, f"{self.phases!r}{backend!r}")
+        shortened_code: Optional[str] = self.cache.get(key)
+        if shortened_code is None:
+            shortened_code = self._shorten_until_cancelled(code, backend, tokens)
+            if not any(token.stopped_early for token in tokens):
+                self.cache.put(key, shortened_code)
+        return shortened_code
+
+    def shorten_to(self, code: str, sink: TextIO, backend: Optional[ParseBackend] = None) -> int:
+        """Shortens `code` into `sink`, writing it as it is unparsed, and returns the length of the shortened code.
+
+        Nothing is written to `sink` if `code` cannot be parsed.
+        """
+        backend = self.backend if backend is None else backend
+        if self.cache is not None:
+            return sink.write(self.shorten(code, backend))
+        return Unparser().unparse_to(self._transform(code, backend), sink)
+
+    def _shorten_until_cancelled(self, code: str, backend: ParseBackend, tokens: List[CancellationToken]) -> str:
+        if not tokens:
+            return self._shorten(code, backend)
+
+        best_so_far: List[str] = [code]
+        try:
+            return self._shorten(code, backend, CancellationToken.any(tokens), best_so_far)
+        except OperationCancelled:
+            for token in tokens:
+                token.stopped_early = True
+            return best_so_far[-1]
+
+    def _shorten(
+        self,
+        code: str,
+        backend: ParseBackend,
+        cancellation: Optional[CancellationToken] = None,
+        best_so_far: Optional[List[str]] = None,
+    ) -> str:
+        module: NodeNG = self._transform(code, backend, cancellation, best_so_far)
+        if best_so_far is not None and len(best_so_far) > 1:
+            return best_so_far[-1]
+        return Unparser(cancellation=cancellation).unparse(module)
+
+    def _transform(
+        self,
+        code: str,
+        backend: ParseBackend,
+        cancellation: Optional[CancellationToken] = None,
+        best_so_far: Optional[List[str]] = None,
+    ) -> NodeNG:
+        module: NodeNG = backend.parse(code)
+
+        for phase in self.phases:
+            if cancellation is not None:
+                cancellation.check()
+            index: NodeIndex = NodeIndex(module, cancellation)
+            registry: RuleRegistry = RuleRegistry(cancellation, index)
+            for rule in phase.generate_rules(module, cancellation, index):
+                registry.register_rule(rule)
+            module = registry.visit(module)
+            if best_so_far is not None:
+                best_so_far.append(Unparser(cancellation=cancellation).unparse(module))
+
+        return module
+
+    def shorten_many(
+        self, codes: Iterable[str], workers: Optional[int] = None, chunksize: int = 1, timeout: Optional[float] = None,
+    ) -> Iterator[BatchResult]:
+        """Shortens `codes` on `workers` processes (one per CPU by default), sending them `chunksize` codes at a time.
+
+        Results are yielded in the order of `codes`: the shortened code, `None` if the code is not valid python code,
+        or a `ShortenFailure` if shortening the code raised, lasted more than `timeout` seconds or crashed its worker.
+        `timeout` relies on `signal.setitimer` and raises a `ValueError` on platforms without it, such as Windows.
+        """
+        batch: ProcessBatch = ProcessBatch(self, workers or os.cpu_count() or 1, timeout)
+        try:
+            for chunk in chunks(codes, chunksize):
+                yield from batch.submit(chunk)
+            yield from batch.drain()
+        finally:
+            batch.shutdown()
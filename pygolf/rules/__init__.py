@@ -1,4 +1,5 @@
 from .astroid_rule import AstroidRule
+from .rule_registry import RuleRegistry
 from .rules import *
 from .version import Version
 
@@ -11,6 +12,8 @@ __all__: List[str] = [
     "RangeForToComprehensionFor",
     "RenameAssignName",
     "RenameCall",
+    "RenameIdentifiers",
     "RenameName",
+    "RuleRegistry",
     "Version",
 ]
@@ -1,9 +1,14 @@
 import abc
+from typing import TYPE_CHECKING, Any, Optional
 
 from astroid.node_classes import NodeNG
 
+from pygolf.helper.node_index import NodeIndex
 from pygolf.rules.version import Version
 
+if TYPE_CHECKING:
+    from pygolf.cost_model import CostModel  # noqa: F401
+
 
 class AstroidRule(metaclass=abc.ABCMeta):
     @abc.abstractmethod
@@ -14,7 +19,17 @@ class AstroidRule(metaclass=abc.ABCMeta):
     def predicate(self, node: NodeNG) -> NodeNG:
         raise NotImplementedError
 
+    def gain(self, node: NodeNG, cost_model: "CostModel") -> int:
+        """Returns the number of characters saved by transforming `node`, exactly or as a close lower bound.
+
+        The rules which do not measure it are taken to save nothing, and are not applied by the phases gating on it.
+        """
+        return 0
+
     def since(self) -> Version:
         return Version.min_version()
 
-    on_node = None
+    # Class of the nodes the rule applies to, or tuple of classes
+    on_node: Any = None
+    # Index of the tree the rule is applied to, set by the registry of the rule if it has one
+    index: Optional[NodeIndex] = None
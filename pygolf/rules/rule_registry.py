@@ -0,0 +1,91 @@
+from typing import *
+
+from astroid.node_classes import NodeNG
+
+from pygolf.cancellation import CancellationToken
+from pygolf.helper import walker
+from pygolf.helper.node_index import NodeIndex
+from pygolf.rules.astroid_rule import AstroidRule
+
+
+class RuleRegistry:
+    """Rules owned by a single caller, applied to a tree in a single traversal.
+
+    Unlike `astroid.MANAGER`, a registry is never shared: rules registered on it only apply to the trees it visits,
+    so several registries can be used concurrently and nothing has to be unregistered if a transform fails.
+    The rules registered on a registry given the `index` of the tree it visits can query it instead of walking the tree.
+    """
+
+    def __init__(self, cancellation: Optional[CancellationToken] = None, index: Optional[NodeIndex] = None) -> None:
+        self.cancellation: Optional[CancellationToken] = cancellation
+        self.index: Optional[NodeIndex] = index
+        # Rules by class of the nodes they apply to, in the order of their registration
+        self.rules: Dict[type, List[AstroidRule]] = {}
+
+    def register_rule(self, rule: AstroidRule) -> None:
+        if self.index is not None:
+            rule.index = self.index
+        node_classes: Any = rule.on_node if isinstance(rule.on_node, tuple) else (rule.on_node,)
+        for node_class in node_classes:
+            self.rules.setdefault(node_class, []).append(rule)
+
+    def visit(self, tree: NodeNG) -> NodeNG:
+        """Applies the rules to the nodes of `tree`, children before their parent, and returns the transformed tree.
+
+        The rules of a class are applied in the order of their registration, until a rule replaces the node
+        by a node of another class.
+        """
+        rules: Dict[type, List[AstroidRule]] = self.rules
+        # Nodes to visit, and `None` where the visit of the children of a node ends
+        stack: List[Optional[NodeNG]] = [tree]
+        # Nodes which children are being visited, with the replacements of their children by id of child
+        parents: List[Tuple[NodeNG, Dict[int, NodeNG]]] = []
+        while stack:
+            node: Optional[NodeNG] = stack.pop()
+            if node is None:
+                node, replacements = parents.pop()
+                if replacements:
+                    _replace_children(node, replacements)
+            else:
+                if self.cancellation is not None:
+                    self.cancellation.check()
+                if node._astroid_fields:
+                    parents.append((node, {}))
+                    stack.append(None)
+                    walker.push_children(stack, node)
+                    continue
+
+            if node.__class__ in rules:
+                transformed: NodeNG = self._transform(node)
+                if transformed is not node:
+                    if not parents:
+                        return transformed
+                    parents[-1][1][id(node)] = transformed
+        return tree
+
+    def _transform(self, node: NodeNG) -> NodeNG:
+        node_class: type = node.__class__
+        for rule in self.rules[node_class]:
+            if rule.predicate(node):
+                node = rule.transform(node)
+                if node.__class__ is not node_class:
+                    break
+        return node
+
+
+def _replace_children(node: NodeNG, replacements: Dict[int, NodeNG]) -> None:
+    for name in node._astroid_fields:
+        value: Any = getattr(node, name)
+        replaced: Any = _replaced(value, replacements)
+        if replaced is not value:
+            setattr(node, name, replaced)
+
+
+def _replaced(value: Any, replacements: Dict[int, NodeNG]) -> Any:
+    if isinstance(value, NodeNG):
+        return replacements.get(id(value), value)
+    if isinstance(value, (list, tuple)):
+        items: List[Any] = [_replaced(item, replacements) for item in value]
+        if any(item is not old_item for item, old_item in zip(items, value)):
+            return items if isinstance(value, list) else tuple(items)
+    return value
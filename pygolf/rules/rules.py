@@ -2,6 +2,7 @@ import re
 from typing import *
 
 import astroid as ast
+from astroid.node_classes import NodeNG
 
 from pygolf.rules.astroid_rule import AstroidRule
 from pygolf.rules.node_creator_helper import create_for_node_with_new_iter, create_format_spec_node
@@ -9,6 +10,9 @@ from pygolf.rules.version import Version
 
 from ..helper import walker
 
+if TYPE_CHECKING:
+    from pygolf.cost_model import CostModel  # noqa: F401
+
 
 class AnnAssignToAssign(AstroidRule):
     on_node = ast.AnnAssign
@@ -56,6 +60,11 @@ class ComprehensionForAssignToMapAssign(AstroidRule):
         new_assign.postinit(targets=node.targets, value=value)
         return new_assign
 
+    def gain(self, node: ast.Assign, cost_model: "CostModel") -> int:
+        # `[f(x)for x in iterator]` becomes `map(f,iterator)`
+        function_name: str = node.value.elt.func.name
+        return cost_model.length(node.value) - len(f"map({function_name},)") - cost_model.length(node.value.generators[0].iter)
+
 
 class DefineRenameCall(AstroidRule):
     def __init__(self, old_name: str, new_name: str) -> None:
@@ -75,7 +84,12 @@ class DefineRenameCall(AstroidRule):
         return new_node
 
     def predicate(self, node: ast.Module) -> bool:
-        for node in walker.walk(node):
+        assigns: Iterable[NodeNG]
+        if self.index is not None and node is self.index.tree:
+            assigns = [assign_name.parent for assign_name in self.index.occurrences(self.new_name)]
+        else:
+            assigns = walker.walk(node, only=ast.Assign, prune=walker.is_expression)
+        for node in assigns:
             if (
                 isinstance(node, ast.Assign)
                 and any(hasattr(n, "name") and n.name == self.new_name for n in node.targets)
@@ -116,6 +130,16 @@ class FormatToFString(AstroidRule):
     def predicate(self, node: ast.Call) -> bool:
         return isinstance(node.func, ast.Attribute) and node.func.attrname == "format"
 
+    def gain(self, node: ast.Call, cost_model: "CostModel") -> int:
+        # The arguments move into the replacement fields of the string, which gets an `f` prefix,
+        # and a space if it follows a keyword: `return'{}'.format(x)` becomes `return f'{x}'`
+        return (
+            cost_model.length(node)
+            - len(" f")
+            - cost_model.length(node.func.expr)
+            - sum(cost_model.length(argument) for argument in node.args)
+        )
+
     def since(self) -> Version:
         return Version("3.6")
 
@@ -139,6 +163,9 @@ class ListAppend(AstroidRule):
     def predicate(self, node: ast.Call) -> bool:
         return isinstance(node.func, ast.Attribute) and node.func.attrname == "append"
 
+    def gain(self, node: ast.Call, cost_model: "CostModel") -> int:
+        return len(".append()") - len("+=[]")
+
     def __repr__(self):
         return "ListAppend"
 
@@ -168,13 +195,26 @@ class RangeForToComprehensionFor(AstroidRule):
 
         target_is_used: bool = False
         target: str = node.target.name
-        for node0 in walker.walk(node):
-            if isinstance(node0, ast.Name) and node0.name == target:
+        if self.index is not None and node in self.index:
+            return not any(isinstance(node0, ast.Name) for node0 in self.index.occurrences(target, inside=node))
+        for node0 in walker.walk(node, only=ast.Name):
+            if node0.name == target:
                 target_is_used = True
                 break
 
         return not target_is_used
 
+    def gain(self, node: ast.For, cost_model: "CostModel") -> int:
+        arguments: List[NodeNG] = node.iter.args
+        if len(arguments) == 1:
+            new_length: int = len("'|'*") + cost_model.length(arguments[0])
+        elif len(arguments) == 2:
+            new_length = len("'|'*(-)") + cost_model.length(arguments[0]) + cost_model.length(arguments[1])
+        else:
+            return 0
+        # `in'|'` needs no space between the keyword and the string
+        return cost_model.length(node.iter) - new_length + len(" ")
+
     def __repr__(self) -> str:
         return "RangeForToComprehensionFor"
 
@@ -222,6 +262,34 @@ class RenameCall(AstroidRule):
         return isinstance(other, RenameCall) and other.new_name == self.new_name and other.old_name == self.old_name
 
 
+class RenameIdentifiers(AstroidRule):
+    """Renames the `Name` and `AssignName` nodes of the identifiers of `renames`, with a single lookup per node."""
+
+    def __init__(self, renames: Optional[Dict[str, str]] = None) -> None:
+        self.renames: Dict[str, str] = renames or {}
+        self.on_node = (ast.Name, ast.AssignName) if self.renames else ()
+
+    def transform(self, node: NodeNG) -> NodeNG:
+        new_name: Optional[str] = self.renames.get(node.name)
+        if new_name is None:
+            return node
+        return node.__class__(lineno=node.lineno, col_offset=node.col_offset, parent=node.parent, name=new_name)
+
+    def predicate(self, node: NodeNG) -> bool:
+        # The renaming is looked up by `transform`, which returns the nodes not renamed unchanged
+        return True
+
+    def restricted_to(self, identifiers: Set[str]) -> "RenameIdentifiers":
+        """Returns the rule renaming only the identifiers among `identifiers`."""
+        return RenameIdentifiers({old: new for old, new in self.renames.items() if old in identifiers})
+
+    def __repr__(self) -> str:
+        return f"RenameIdentifiers(renames:{self.renames})"
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, RenameIdentifiers) and other.renames == self.renames
+
+
 class RenameName(AstroidRule):
     def __init__(self, old_name: str, new_name: str) -> None:
         self.new_name: str = new_name
@@ -3,17 +3,137 @@ from typing import *
 import astroid as ast
 from astroid.node_classes import NodeNG
 
+from pygolf.cancellation import CancellationToken
 from pygolf.errors.python_2_code_detected import Python2CodeDetected
 
+_operators_level: Dict[str, int] = {
+    "|": 0,
+    "^": 1,
+    "&": 2,
+    "<<": 3,
+    ">>": 3,
+    "+": 4,
+    "-": 4,
+    "*": 5,
+    "//": 5,
+    "/": 5,
+    "%": 5,
+    "**": 6,
+}
+
+_block_classes: FrozenSet[type] = frozenset(
+    {
+        ast.AsyncFor,
+        ast.AsyncFunctionDef,
+        ast.AsyncWith,
+        ast.ClassDef,
+        ast.FunctionDef,
+        ast.For,
+        ast.If,
+        ast.TryExcept,
+        ast.TryFinally,
+        ast.With,
+        ast.While,
+    }
+)
+
+
+# Child node to write, with the indentation of its block if it is a statement
+_Child = Union[NodeNG, Tuple[NodeNG, int]]
+_Writer = Callable[["Unparser", NodeNG, int], Optional[Iterator[_Child]]]
+# Length of the code of a node, and its first and last characters standing in for it in the fragments
+_Measure = Tuple[int, str]
+
 
 class Unparser:
-    def __init__(self, should_remove_spaces_between_keywords: bool = True) -> None:
+    """Unparses nodes into an append-only list of fragments, shared by the whole traversal and joined once at its end.
+
+    Writers `_unparse_X` append the code of their node to the fragments, and yield their children to write them in place,
+    the public `unparse_X` methods are generated from them and return the code as a string.
+    The writers are run on an explicit stack, so that the depth of the code is not limited by the recursion limit.
+    """
+
+    # Number of fragments written at once to the stream of `unparse_to`
+    chunk_size: int = 1024
+    # Writers of the node classes, built once per class from its `_unparse_X` methods
+    _writers: Dict[type, _Writer] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._build_writers()
+
+    @classmethod
+    def _build_writers(cls) -> None:
+        cls._writers = {}
+        for writer_name in dir(cls):
+            if writer_name.startswith("_unparse_"):
+                node_class = getattr(ast, writer_name.replace("_unparse_", "", 1), None)
+                if isinstance(node_class, type):
+                    cls._writers[node_class] = getattr(cls, writer_name)
+                if not hasattr(cls, writer_name[1:]):
+                    setattr(cls, writer_name[1:], _unparse_into_string(writer_name))
+
+    def __init__(
+        self, should_remove_spaces_between_keywords: bool = True, cancellation: Optional[CancellationToken] = None
+    ) -> None:
         self.sep: str = " "
         self.should_remove_spaces_between_keywords = should_remove_spaces_between_keywords
+        self.cancellation: Optional[CancellationToken] = cancellation
+        self.fragments: List[str] = []
+        self._write: Callable[[str], None] = self.fragments.append
+        # Measures of the nodes unparsed by `unparse_length`, by node and indentation
+        self.lengths: Dict[Tuple[NodeNG, int], _Measure] = {}
+        self._measuring: bool = False
+        self._hidden_length: int = 0
+        # Stream written by `unparse_to`, with the number of fragments and of characters written to it, its last character,
+        # and the positions of the fragments which the writers may still read or replace, which cannot be written yet
+        self._stream: Optional[TextIO] = None
+        self._flushed: int = 0
+        self._flushed_length: int = 0
+        self._flushed_last_character: str = ""
+        self._pins: List[int] = []
 
     def unparse(self, node: NodeNG, indent: int = 0) -> str:
-        method = getattr(self, "unparse_" + node.__class__.__name__)
-        return method(node, indent)  # type: ignore
+        return self._collect(self._write_node, node, indent)
+
+    def unparse_length(self, node: NodeNG, indent: int = 0) -> int:
+        """Returns the length of the code of `node`, without building the code.
+
+        The length of every subtree is cached in `lengths`, measuring a tree sharing subtrees with the trees already
+        measured only writes its new nodes. Measured nodes must not be modified, or `lengths` must be cleared.
+        """
+        start: int = len(self.fragments)
+        try:
+            self._measuring = True
+            self._measure(node, indent)
+            return self.lengths[node, indent][0]
+        finally:
+            del self.fragments[start:]
+            self._measuring = False
+            self._hidden_length = 0
+
+    def unparse_to(self, node: NodeNG, stream: TextIO) -> int:
+        """Writes `node` unparsed into `stream` while it is unparsed, returns the number of characters written.
+
+        The fragments are written in chunks of about `chunk_size` fragments, as soon as the writers cannot change them,
+        so that the code is never held whole in memory, except an expression after a keyword until it is written.
+        """
+        self._stream, self._flushed, self._flushed_length, self._flushed_last_character, self._pins = stream, 0, 0, "", []
+        try:
+            if isinstance(node, ast.Module):
+                # The statements are written apart from the module, which joins the fragments of each statement
+                separator: str = "\n" if self.has_block(node.body) else ";"
+                for i, statement in enumerate(node.body):
+                    if i != 0:
+                        self._write(separator)
+                    self._write_node(statement)
+            else:
+                self._write_node(node)
+            self._flush(len(self.fragments))
+            return self._flushed_length
+        finally:
+            del self.fragments[:]
+            self._stream, self._flushed, self._flushed_last_character, self._pins = None, 0, "", []
 
     def unparse_alias_import(self, node: List[Tuple[str, Optional[str]]]) -> str:
         import_name, alias = node
@@ -22,141 +142,330 @@ class Unparser:
 
         return f"{import_name} as {alias}"
 
-    def unparse_block(self, block: List[NodeNG], indent: int = 0) -> str:
+    def _collect(self, writer: Callable[..., Optional[Iterator[_Child]]], *args: Any) -> str:
+        start: int = len(self.fragments)
+        try:
+            self._run(writer(*args))
+            return "".join(self.fragments[start:] if start != 0 else self.fragments)
+        finally:
+            del self.fragments[start:]
+
+    def _write_node(self, node: NodeNG, indent: int = 0) -> None:
+        self._run(iter([(node, indent)]))
+
+    def _run(self, writing: Optional[Iterator[_Child]]) -> None:
+        """Runs `writing` and the writers of the children it yields, depth first."""
+        if writing is None:
+            return
+        stack: List[Iterator[_Child]] = [writing]
+        writers: Dict[type, _Writer] = self._writers
+        while stack:
+            try:
+                child: _Child = next(stack[-1])
+            except StopIteration:
+                stack.pop()
+                continue
+
+            indent: int = 0
+            if child.__class__ is tuple:
+                child, indent = child  # type: ignore
+            if self.cancellation is not None:
+                self.cancellation.check()
+            writer: Optional[_Writer] = writers.get(child.__class__)
+            if writer is None:
+                raise AttributeError(f"{self.__class__.__name__} cannot unparse {child.__class__.__name__} nodes")
+            child_writing: Optional[Iterator[_Child]] = writer(self, child, indent)  # type: ignore
+            if child_writing is not None:
+                stack.append(child_writing)
+            if self._stream is not None and len(self.fragments) >= self.chunk_size:
+                self._flush_unpinned()
+
+    def _writer(self, node: NodeNG) -> _Writer:
+        """Returns the writer of `node`, checking the cancellation of the unparser first."""
+        if self.cancellation is not None:
+            self.cancellation.check()
+        writer: Optional[_Writer] = self._writers.get(node.__class__)
+        if writer is None:
+            raise AttributeError(f"{self.__class__.__name__} cannot unparse {node.__class__.__name__} nodes")
+        return writer
+
+    def _flush_unpinned(self) -> None:
+        end: int = self._pins[0] - self._flushed if self._pins else len(self.fragments)
+        if end >= self.chunk_size:
+            self._flush(end)
+
+    def _flush(self, end: int) -> None:
+        """Writes the first `end` fragments to the stream of `unparse_to`, and removes them from the fragments."""
+        assert self._stream is not None
+        code: str = "".join(self.fragments[:end])
+        if code:
+            self._flushed_length += self._stream.write(code)
+            self._flushed_last_character = code[-1]
+        del self.fragments[:end]
+        self._flushed += end
+
+    def _position(self) -> int:
+        """Returns the position of the next fragment, counting the fragments already written to the stream."""
+        return self._flushed + len(self.fragments)
+
+    def _measure(self, node: NodeNG, indent: int) -> None:
+        """Writes `node` as `_run` does, replacing the fragments of each written subtree by its first and last characters.
+
+        Only the characters left out are counted, in `_hidden_length`, and subtrees already measured are not written again.
+        """
+        # Writings of the subtrees, with their node and indentation, the start of their fragments and the hidden length then
+        stack: List[Tuple[Iterator[_Child], Optional[Tuple[NodeNG, int]], int, int]] = []
+        fragments: List[str] = self.fragments
+        writing: Iterator[_Child] = iter([(node, indent)])
+        key: Optional[Tuple[NodeNG, int]] = None
+        start: int = 0
+        hidden_length: int = 0
+        while True:
+            try:
+                child: _Child = next(writing)
+            except StopIteration:
+                if key is not None:
+                    self._store_measure(key, start, hidden_length)
+                if not stack:
+                    return
+                writing, key, start, hidden_length = stack.pop()
+                continue
+
+            child_indent: int = 0
+            if child.__class__ is tuple:
+                child, child_indent = child  # type: ignore
+            child_key: Optional[Tuple[NodeNG, int]] = (child, child_indent) if self._measuring else None
+            if child_key is not None and self._write_stand_in(child_key):
+                continue
+
+            writer: _Writer = self._writer(child)
+            child_start: int = len(fragments)
+            child_hidden_length: int = self._hidden_length
+            child_writing: Optional[Iterator[_Child]] = writer(self, child, child_indent)  # type: ignore
+            if child_writing is not None:
+                stack.append((writing, key, start, hidden_length))
+                writing, key, start, hidden_length = child_writing, child_key, child_start, child_hidden_length
+            elif child_key is not None:
+                self._store_measure(child_key, child_start, child_hidden_length)
+
+    def _write_stand_in(self, key: Tuple[NodeNG, int]) -> bool:
+        """Writes the stand-in of the subtree `key` if it is already measured, and returns whether it is."""
+        measure: Optional[_Measure] = self.lengths.get(key)
+        if measure is None:
+            return False
+        length, stand_in = measure
+        if stand_in:
+            self.fragments.append(stand_in)
+        self._hidden_length += length - len(stand_in)
+        return True
+
+    def _store_measure(self, key: Tuple[NodeNG, int], start: int, hidden_length: int) -> None:
+        fragments: List[str] = self.fragments
+        # The fragments of the subtree are its own code and the stand-ins of its children, they are short to join
+        written: str = fragments[start] if len(fragments) == start + 1 else "".join(fragments[start:])
+        length: int = len(written) + self._hidden_length - hidden_length
+        if len(written) > 2:
+            stand_in: str = written[0] + written[-1]
+            self._hidden_length = hidden_length + length - 2
+            fragments[start:] = [stand_in]
+        else:
+            stand_in = written
+            if len(fragments) != start + 1:
+                fragments[start:] = [stand_in] if stand_in else []
+        self.lengths[key] = (length, stand_in)
+
+    def _write_nodes(self, separator: str, nodes: Iterable[NodeNG], indent: int = 0) -> Iterator[_Child]:
+        for i, node in enumerate(nodes):
+            if i != 0:
+                self._write(separator)
+            yield node, indent
+
+    def _unparsed(self, node: NodeNG) -> Generator[_Child, None, str]:
+        """Writes `node` apart from the fragments and returns its code."""
+        start: int = self._position()
+        measuring, self._measuring = self._measuring, False
+        self._pins.append(start)
+        yield node
+        self._pins.pop()
+        self._measuring = measuring
+        start -= self._flushed
+        unparsed: str = "".join(self.fragments[start:])
+        del self.fragments[start:]
+        return unparsed
+
+    def _write_node_after_kw(self, node: NodeNG) -> Generator[_Child, None, int]:
+        """Writes `node` after a keyword, with a space in between if needed, and returns the index of its first fragment."""
+        space_index: int = self._position()
+        self._write("")
+        self._pins.append(space_index)
+        yield node
+        self._pins.pop()
+        self._write_space_after_kw(self._first_character(space_index + 1), space_index)
+        return space_index + 1
+
+    def _write_space_after_kw(self, first_character: str, index: Optional[int] = None) -> None:
+        space: str = "" if self._can_follow_reserved_keywords(first_character) else " "
+        if index is None:
+            self._write(space)
+        else:
+            self.fragments[index - self._flushed] = space
+
+    def _write_space_before_kw(self) -> None:
+        """Writes the space between the code written last and a keyword, if needed."""
+        self._write("" if self._can_be_before_reserved_keywords(self._last_character()) else " ")
+
+    def _first_character(self, start: int) -> str:
+        fragments: List[str] = self.fragments
+        for i in range(start - self._flushed, len(fragments)):
+            if fragments[i]:
+                return fragments[i][0]
+        return ""
+
+    def _last_character(self) -> str:
+        fragments: List[str] = self.fragments
+        for i in range(len(fragments) - 1, -1, -1):
+            if fragments[i]:
+                return fragments[i][-1]
+        return self._flushed_last_character
+
+    def _unparse_block(self, block: List[NodeNG], indent: int = 0) -> Iterator[_Child]:
         if self.has_block(block):
-            return "\n" + "\n".join(map(lambda x: self.unparse(x, indent + 1), block))
-        return ";".join(map(self.unparse, block))
-
-    def unparse_comprehension_generators(self, generators: List[ast.Comprehension], indent: int = 0) -> str:
-        stmnt = ""
+            for node in block:
+                self._write("\n")
+                yield node, indent + 1
+        else:
+            yield from self._write_nodes(";", block)
 
+    def _unparse_comprehension_generators(self, generators: List[ast.Comprehension], indent: int = 0) -> Iterator[_Child]:
         for i, generator in enumerate(generators):
-            stmnt += self.unparse(generator)
+            yield generator
             if i != len(generators) - 1:
-                stmnt += self.space_before_kw(generator)
+                self._write_space_before_kw()
 
-        return stmnt
-
-    def unparse_for(self, for_node: Union[ast.AsyncFor, ast.For], is_async: bool, indent: int = 0) -> str:
-        for_stmnt = (
-            f"{self.sep*indent}{'async ' if is_async else ''}"
-            f"for {self.unparse(for_node.target)} in{self.space_after_kw(for_node.iter)}"
-            f"{self.unparse(for_node.iter)}:{self.unparse_block(for_node.body, indent)}"
-        )
+    def _unparse_for(self, for_node: Union[ast.AsyncFor, ast.For], is_async: bool, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}{'async ' if is_async else ''}for ")
+        yield for_node.target
+        self._write(" in")
+        yield from self._write_node_after_kw(for_node.iter)
+        self._write(":")
+        yield from self._unparse_block(for_node.body, indent)
 
         if for_node.orelse:
-            for_stmnt += f"\n{self.sep*indent}else:{self.unparse_block(for_node.orelse, indent)}"
-
-        return for_stmnt
+            self._write(f"\n{self.sep*indent}else:")
+            yield from self._unparse_block(for_node.orelse, indent)
 
-    def unparse_function_def(
+    def _unparse_function_def(
         self, node: Union[ast.AsyncFunctionDef, ast.FunctionDef], is_async: bool, indent: int = 0,
-    ) -> str:
+    ) -> Iterator[_Child]:
         if node.decorators is not None:
-            stmt = self.unparse(node.decorators, indent) + "\n"
-        else:
-            stmt = ""
-        stmt += (
-            f"{self.sep*indent}{'async ' if is_async else ''}def "
-            f"{node.name}({self.unparse(node.args)}):{self.unparse_block(node.body, indent)}"
-        )
-
-        return stmt
-
-    def unparse_with(self, node: Union[ast.AsyncWith, ast.With], is_async: bool, indent: int = 0) -> str:
-        return (
-            f"{self.sep*indent}{'async ' if is_async else ''}with "
-            f"{','.join(map(self.unparse_with_item, node.items))}:" + self.unparse_block(node.body, indent)
-        )
-
-    def unparse_with_item(self, node: List[Tuple[NodeNG, Optional[ast.AssignName]]]) -> str:
+            yield node.decorators, indent
+            self._write("\n")
+        self._write(f"{self.sep*indent}{'async ' if is_async else ''}def {node.name}(")
+        yield node.args
+        self._write("):")
+        yield from self._unparse_block(node.body, indent)
+
+    def _unparse_with(self, node: Union[ast.AsyncWith, ast.With], is_async: bool, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}{'async ' if is_async else ''}with ")
+        for i, item in enumerate(node.items):
+            if i != 0:
+                self._write(",")
+            yield from self._unparse_with_item(item)
+        self._write(":")
+        yield from self._unparse_block(node.body, indent)
+
+    def _unparse_with_item(self, node: List[Tuple[NodeNG, Optional[ast.AssignName]]]) -> Iterator[_Child]:
         item, alias = node
-        if alias is None:
-            return self.unparse(item)
-        return f"{self.unparse(item)} as {self.unparse(alias)}"
+        yield item
+        if alias is not None:
+            self._write(" as ")
+            yield alias
 
-    def unparse_AnnAssign(self, node: ast.AnnAssign, indent: int = 0) -> str:
+    def _unparse_AnnAssign(self, node: ast.AnnAssign, indent: int = 0) -> Iterator[_Child]:
         if node.value is not None:
             name = node.target.name if hasattr(node.target, "name") else node.target.attrname
-            return f"{self.sep*indent}{name}={self.unparse(node.value)}"  # ignore annotation
-        return f"{self.sep*indent}{node.target.name}"
+            self._write(f"{self.sep*indent}{name}=")
+            yield node.value  # ignore annotation
+        else:
+            self._write(f"{self.sep*indent}{node.target.name}")
 
-    def unparse_Arguments(self, node: ast.Arguments, indent: int = 0) -> str:
+    def _unparse_Arguments(self, node: ast.Arguments, indent: int = 0) -> Iterator[_Child]:
         number_non_default_args = len(node.args) - len(node.defaults)
-        return ",".join(
-            self.unparse(arg)
-            if i < number_non_default_args
-            else f"{self.unparse(arg)}={self.unparse(node.defaults[i-number_non_default_args])}"
-            for i, arg in enumerate(node.args)
-        )
-
-    def unparse_Assert(self, node: ast.Assert, indent: int = 0) -> str:
+        for i, arg in enumerate(node.args):
+            if i != 0:
+                self._write(",")
+            yield arg
+            if i >= number_non_default_args:
+                self._write("=")
+                yield node.defaults[i - number_non_default_args]
+
+    def _unparse_Assert(self, node: ast.Assert, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}assert ")
+        yield node.test
         if node.fail is not None:
-            return f"{self.sep*indent}assert {self.unparse(node.test)},{self.unparse(node.fail)}"
-        return f"{self.sep*indent}assert {self.unparse(node.test)}"
+            self._write(",")
+            yield node.fail
 
-    def unparse_Assign(self, node: ast.Assign, indent: int = 0) -> str:
+    def _unparse_Assign(self, node: ast.Assign, indent: int = 0) -> Iterator[_Child]:
+        self._write(self.sep * indent)
         if (
             isinstance(node.targets[0], ast.Tuple)
             and len(node.targets[0].elts) == 1
             and isinstance(node.targets[0].elts[0], ast.Starred)
         ):
-            return f"{self.sep*indent}{self.unparse(node.targets[0])},={self.unparse(node.value)}"
-        return f"{self.sep*indent}{'='.join(map(self.unparse, node.targets))}={self.unparse(node.value)}"
-
-    def unparse_AssignAttr(self, node: ast.AssignAttr, indent: int = 0) -> str:
-        return f"{self.sep*indent}{self.unparse(node.expr)}.{node.attrname}"
-
-    def unparse_AssignName(self, node: ast.AssignName, indent: int = 0) -> str:
-        return f"{self.sep*indent}{node.name}"
+            yield node.targets[0]
+            self._write(",=")
+        else:
+            yield from self._write_nodes("=", node.targets)
+            self._write("=")
+        yield node.value
 
-    def unparse_AsyncFor(self, node: ast.AsyncFor, indent: int = 0) -> str:
-        return self.unparse_for(node, True, indent)
+    def _unparse_AssignAttr(self, node: ast.AssignAttr, indent: int = 0) -> Iterator[_Child]:
+        self._write(self.sep * indent)
+        yield node.expr
+        self._write(f".{node.attrname}")
 
-    def unparse_AsyncFunctionDef(self, node: ast.AsyncFunctionDef, indent: int = 0) -> str:
-        return self.unparse_function_def(node, True, indent)
+    def _unparse_AssignName(self, node: ast.AssignName, indent: int = 0) -> None:
+        self._write(f"{self.sep*indent}{node.name}")
 
-    def unparse_AsyncWith(self, node: ast.AsyncWith, indent: int = 0) -> str:
-        return self.unparse_with(node, True, indent)
+    def _unparse_AsyncFor(self, node: ast.AsyncFor, indent: int = 0) -> Iterator[_Child]:
+        return self._unparse_for(node, True, indent)
 
-    def unparse_Attribute(self, node: ast.Attribute, indent: int = 0) -> str:
-        return f"{self.sep*indent}{self.unparse(node.expr)}.{node.attrname}"
+    def _unparse_AsyncFunctionDef(self, node: ast.AsyncFunctionDef, indent: int = 0) -> Iterator[_Child]:
+        return self._unparse_function_def(node, True, indent)
 
-    def unparse_AugAssign(self, node: ast.AugAssign, indent: int = 0) -> str:
-        return f"{self.sep*indent}{self.unparse(node.target)}{node.op}{self.unparse(node.value)}"
+    def _unparse_AsyncWith(self, node: ast.AsyncWith, indent: int = 0) -> Iterator[_Child]:
+        return self._unparse_with(node, True, indent)
 
-    def unparse_Await(self, node: ast.Await, indent: int = 0) -> str:
-        return f"{self.sep*indent}await"
+    def _unparse_Attribute(self, node: ast.Attribute, indent: int = 0) -> Iterator[_Child]:
+        self._write(self.sep * indent)
+        yield node.expr
+        self._write(f".{node.attrname}")
 
-    def unparse_BinOp(self, node: ast.BinOp, indent: int = 0) -> str:
-        operators_level = {
-            "|": 0,
-            "^": 1,
-            "&": 2,
-            "<<": 3,
-            ">>": 3,
-            "+": 4,
-            "-": 4,
-            "*": 5,
-            "//": 5,
-            "/": 5,
-            "%": 5,
-            "**": 6,
-        }
+    def _unparse_AugAssign(self, node: ast.AugAssign, indent: int = 0) -> Iterator[_Child]:
+        self._write(self.sep * indent)
+        yield node.target
+        self._write(node.op)
+        yield node.value
 
-        stmnt = ""
+    def _unparse_Await(self, node: ast.Await, indent: int = 0) -> None:
+        self._write(f"{self.sep*indent}await")
 
-        def unparse_child(node: ast.BinOp, child_node: NodeNG, already_have_parenthesis=False) -> str:
+    def _unparse_BinOp(self, node: ast.BinOp, indent: int = 0) -> Iterator[_Child]:
+        def write_child(node: ast.BinOp, child_node: NodeNG, already_have_parenthesis=False) -> Iterator[_Child]:
             if (
                 not already_have_parenthesis
                 and isinstance(child_node, ast.BinOp)
-                and operators_level[node.op] > operators_level[child_node.op]
+                and _operators_level[node.op] > _operators_level[child_node.op]
             ):
-                return f"({self.unparse(child_node)})"
-            return f"{self.unparse(child_node)}"
+                self._write("(")
+                yield child_node
+                self._write(")")
+            else:
+                yield child_node
 
-        stmnt += unparse_child(node, node.left)
-        stmnt += node.op
+        yield from write_child(node, node.left)
+        self._write(node.op)
 
         if (
             (
@@ -166,352 +475,392 @@ class Unparser:
                 )  # Possibly a string is returned, in doubt we have to put parenthesis
                 or (isinstance(node.right, ast.Compare))
             )
-            and operators_level[node.op] > 4
+            and _operators_level[node.op] > 4
             and (isinstance(node.right, ast.BinOp) or isinstance(node.right, ast.Compare))
         ):
-            stmnt += f"({unparse_child(node, node.right, already_have_parenthesis=True)})"
+            self._write("(")
+            yield from write_child(node, node.right, already_have_parenthesis=True)
+            self._write(")")
         else:
-            stmnt += unparse_child(node, node.right)
-
-        return stmnt
-
-    def unparse_BoolOp(self, node: ast.BoolOp, indent: int = 0) -> str:
-        stmnt = ""
+            yield from write_child(node, node.right)
 
+    def _unparse_BoolOp(self, node: ast.BoolOp, indent: int = 0) -> Iterator[_Child]:
         for i, target in enumerate(node.values):
             if i == 0:
-                stmnt += f"{self.unparse(target)}{self.space_before_kw(target)}{node.op}"
+                yield target
+                self._write_space_before_kw()
+                self._write(node.op)
             else:
-                stmnt += f"{self.space_after_kw(target)}{self.unparse(target)}"
+                yield from self._write_node_after_kw(target)
                 if i != len(node.values) - 1:
-                    stmnt += f"{self.space_before_kw(target)}{node.op}"
-
-        return stmnt
+                    self._write_space_before_kw()
+                    self._write(node.op)
 
-    def unparse_Break(self, node: ast.Break, indent: int = 0) -> str:
-        return f"{self.sep*indent}break"
+    def _unparse_Break(self, node: ast.Break, indent: int = 0) -> None:
+        self._write(f"{self.sep*indent}break")
 
-    def unparse_Call(self, node: ast.Call, indent: int = 0) -> str:
+    def _unparse_Call(self, node: ast.Call, indent: int = 0) -> Iterator[_Child]:
         args: List[NodeNG] = []
         if node.args is not None:
             args += node.args
         if node.keywords is not None:
             args += node.keywords
-        return f"{self.unparse(node.func)}({','.join(map(self.unparse, args))})"
+        yield node.func
+        self._write("(")
+        yield from self._write_nodes(",", args)
+        self._write(")")
 
-    def unparse_ClassDef(self, node: ast.ClassDef, indent: int = 0) -> str:
+    def _unparse_ClassDef(self, node: ast.ClassDef, indent: int = 0) -> Iterator[_Child]:
         if node.decorators is not None:
-            stmnt = self.unparse(node.decorators, indent) + "\n"
-        else:
-            stmnt = ""
+            yield node.decorators, indent
+            self._write("\n")
 
-        stmnt += f"{self.sep*indent}class {node.name}"
+        self._write(f"{self.sep*indent}class {node.name}")
 
         if node.bases:
-            stmnt += f"({','.join(map(self.unparse, node.bases))})"
+            self._write("(")
+            yield from self._write_nodes(",", node.bases)
+            self._write(")")
 
-        stmnt += ":"
+        self._write(":")
+        yield from self._unparse_block(node.body, indent)
 
-        return stmnt + self.unparse_block(node.body, indent)
-
-    def unparse_Compare(self, node: ast.Compare, indent: int = 0) -> str:
-        stmnt = self.unparse(node.left)
+    def _unparse_Compare(self, node: ast.Compare, indent: int = 0) -> Iterator[_Child]:
+        yield node.left
 
         for op, arg in node.ops:
             if op in ("in", "not in", "is", "is not"):
-                stmnt += f" {op}{self.space_after_kw(arg)}{self.unparse(arg)}"
+                self._write(f" {op}")
+                yield from self._write_node_after_kw(arg)
             else:
-                stmnt += op + self.unparse(arg)
-
-        return stmnt
+                self._write(op)
+                yield arg
+
+    def _unparse_Comprehension(self, node: ast.Comprehension, indent: int = 0) -> Iterator[_Child]:
+        self._write("for ")
+        yield node.target
+        self._write_space_before_kw()
+        self._write("in")
+        yield from self._write_node_after_kw(node.iter)
+        previous_if_start: int = 0
+        for i, if_stmnt in enumerate(node.ifs):
+            if i == 0:
+                self._write_space_before_kw()
+            else:
+                self._write_space_after_kw(self._first_character(previous_if_start))
+            self._write("if")
+            previous_if_start = yield from self._write_node_after_kw(if_stmnt)
 
-    def unparse_Comprehension(self, node: ast.Comprehension, indent: int = 0) -> str:
-        stmnt = (
-            f"for {self.unparse(node.target)}"
-            f"{self.space_before_kw(node.target)}"
-            f"in{self.space_after_kw(node.iter)}{self.unparse(node.iter)}"
-        )
-        if stmnt is not None:
-            for i, if_stmnt in enumerate(node.ifs):
-                if i == 0:
-                    stmnt += self.space_before_kw(node.iter)
-                else:
-                    stmnt += self.space_after_kw(node.ifs[i - 1])
-                stmnt += f"if{self.space_after_kw(if_stmnt)}{self.unparse(if_stmnt)}"
-        return stmnt
-
-    def unparse_Const(self, node: ast.Const, indent: int = 0) -> str:
+    def _unparse_Const(self, node: ast.Const, indent: int = 0) -> None:
         if "str" in node.pytype():
             quotes = "'''" if "\n" in node.value else "'"
-            return f"{quotes}{node.value}{quotes}"
-        return str(node.value)
-
-    def unparse_Continue(self, node: ast.Continue, indent: int = 0) -> str:
-        return f"{self.sep*indent}continue"
-
-    def unparse_Decorators(self, node: ast.Decorators, indent: int = 0) -> str:
-        return "\n".join(f"{self.sep*indent}@{self.unparse(decorator)}" for decorator in node.nodes)
-
-    def unparse_DelAttr(self, node: ast.DelAttr, indent: int = 0) -> str:
-        return f"{self.unparse(node.expr)}.{node.attrname}"
-
-    def unparse_DelName(self, node: ast.DelName, indent: int = 0) -> str:
-        return node.name  # type: ignore
-
-    def unparse_Delete(self, node: ast.Delete, indent: int = 0) -> str:
-        return f"{self.sep*indent}del {','.join(map(self.unparse, node.targets))}"
-
-    def unparse_Dict(self, node: ast.Dict, indent: int = 0) -> str:
-        dict_values = ",".join(self.unparse(key) + ":" + self.unparse(value) for key, value in node.items)
-        return f"{self.sep*indent}{{{dict_values}}}"
-
-    def unparse_DictComp(self, node: ast.DictComp, indent: int = 0) -> str:
-        return (
-            f"{self.sep*indent}{{{self.unparse(node.key)}:{self.unparse(node.value)}"
-            f"{self.space_before_kw(node.value)}"
-            f"{self.unparse_comprehension_generators(node.generators)}}}"
-        )
-
-    def unparse_DictUnpack(self, node: ast.DictUnpack, indent: int = 0) -> str:
-        return f"{self.sep*indent}**"
-
-    def unparse_Ellipsis(self, node: ast.Ellipsis, indent: int = 0) -> str:
-        return f"{self.sep*indent}..."
-
-    def unparse_EmptyNode(self, node: ast.EmptyNode, indent: int = 0) -> str:
+            self._write(f"{quotes}{node.value}{quotes}")
+        else:
+            self._write(str(node.value))
+
+    def _unparse_Continue(self, node: ast.Continue, indent: int = 0) -> None:
+        self._write(f"{self.sep*indent}continue")
+
+    def _unparse_Decorators(self, node: ast.Decorators, indent: int = 0) -> Iterator[_Child]:
+        for i, decorator in enumerate(node.nodes):
+            if i != 0:
+                self._write("\n")
+            self._write(f"{self.sep*indent}@")
+            yield decorator
+
+    def _unparse_DelAttr(self, node: ast.DelAttr, indent: int = 0) -> Iterator[_Child]:
+        yield node.expr
+        self._write(f".{node.attrname}")
+
+    def _unparse_DelName(self, node: ast.DelName, indent: int = 0) -> None:
+        self._write(node.name)
+
+    def _unparse_Delete(self, node: ast.Delete, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}del ")
+        yield from self._write_nodes(",", node.targets)
+
+    def _unparse_Dict(self, node: ast.Dict, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}{{")
+        for i, (key, value) in enumerate(node.items):
+            if i != 0:
+                self._write(",")
+            yield key
+            self._write(":")
+            yield value
+        self._write("}")
+
+    def _unparse_DictComp(self, node: ast.DictComp, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}{{")
+        yield node.key
+        self._write(":")
+        yield node.value
+        self._write_space_before_kw()
+        yield from self._unparse_comprehension_generators(node.generators)
+        self._write("}")
+
+    def _unparse_DictUnpack(self, node: ast.DictUnpack, indent: int = 0) -> None:
+        self._write(f"{self.sep*indent}**")
+
+    def _unparse_Ellipsis(self, node: ast.Ellipsis, indent: int = 0) -> None:
+        self._write(f"{self.sep*indent}...")
+
+    def _unparse_EmptyNode(self, node: ast.EmptyNode, indent: int = 0) -> None:
         pass
 
-    def unparse_ExceptHandler(self, node: ast.ExceptHandler, indent: int = 0) -> str:
-        stmnt = f"{self.sep*indent}except {self.unparse(node.type)}"
+    def _unparse_ExceptHandler(self, node: ast.ExceptHandler, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}except ")
+        yield node.type
         if node.name is not None:
-            stmnt += f" as {self.unparse(node.name)}"
-        return f"{stmnt}:{self.unparse_block(node.body, indent)}"
+            self._write(" as ")
+            yield node.name
+        self._write(":")
+        yield from self._unparse_block(node.body, indent)
 
-    def unparse_Exec(self, node: ast.Exec, indent: int = 0) -> str:
+    def _unparse_Exec(self, node: ast.Exec, indent: int = 0) -> None:
         raise Python2CodeDetected(node.__class__.__name__)
 
-    def unparse_Expr(self, node: ast.Expr, indent: int = 0) -> str:
-        return f"{self.sep*indent}{self.unparse(node.value)}"
+    def _unparse_Expr(self, node: ast.Expr, indent: int = 0) -> Iterator[_Child]:
+        self._write(self.sep * indent)
+        yield node.value
 
-    def unparse_ExtSlice(self, node: ast.ExtSlice, indent: int = 0) -> str:
-        return ",".join(map(self.unparse, node.dims))
+    def _unparse_ExtSlice(self, node: ast.ExtSlice, indent: int = 0) -> Iterator[_Child]:
+        yield from self._write_nodes(",", node.dims)
 
-    def unparse_For(self, node: ast.For, indent: int = 0) -> str:
-        return self.unparse_for(node, False, indent)
+    def _unparse_For(self, node: ast.For, indent: int = 0) -> Iterator[_Child]:
+        return self._unparse_for(node, False, indent)
 
-    def unparse_FormattedValue(self, node: ast.FormattedValue, indent: int = 0) -> str:
-        unparsed_node = self.unparse(node.value).replace("'", '"')
+    def _unparse_FormattedValue(self, node: ast.FormattedValue, indent: int = 0) -> Iterator[_Child]:
+        unparsed_node = (yield from self._unparsed(node.value)).replace("'", '"')
         spec = node.format_spec.values[0] if node.format_spec is not None else None
         if spec is not None and spec.value != "''":
-            unparsed_spec = self.unparse(spec).strip("'")
-            return f"{{{unparsed_node}:{unparsed_spec}}}"
-        return f"{{{unparsed_node}}}"
-
-    def unparse_FunctionDef(self, node: ast.FunctionDef, indent: int = 0) -> str:
-        return self.unparse_function_def(node, False, indent)
-
-    def unparse_GeneratorExp(self, node: ast.GeneratorExp, indent: int = 0) -> str:
-        return (
-            f"{self.sep*indent}({self.unparse(node.elt)}{self.space_before_kw(node.elt)}"
-            f"{self.unparse_comprehension_generators(node.generators)})"
-        )
-
-    def unparse_Global(self, node: ast.Global, indent: int = 0) -> str:
-        return f"{self.sep*indent}global {','.join(node.names)}"
-
-    def unparse_If(self, node: ast.If, indent: int = 0) -> str:
-        stmnt = (
-            f"{self.sep*indent}if{self.space_after_kw(node.test)}{self.unparse(node.test)}:"
-            f"{self.unparse_block(node.body, indent)}"
-        )
+            unparsed_spec = (yield from self._unparsed(spec)).strip("'")
+            self._write(f"{{{unparsed_node}:{unparsed_spec}}}")
+        else:
+            self._write(f"{{{unparsed_node}}}")
+
+    def _unparse_FunctionDef(self, node: ast.FunctionDef, indent: int = 0) -> Iterator[_Child]:
+        return self._unparse_function_def(node, False, indent)
+
+    def _unparse_GeneratorExp(self, node: ast.GeneratorExp, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}(")
+        yield node.elt
+        self._write_space_before_kw()
+        yield from self._unparse_comprehension_generators(node.generators)
+        self._write(")")
+
+    def _unparse_Global(self, node: ast.Global, indent: int = 0) -> None:
+        self._write(f"{self.sep*indent}global {','.join(node.names)}")
+
+    def _unparse_If(self, node: ast.If, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}if")
+        yield from self._write_node_after_kw(node.test)
+        self._write(":")
+        yield from self._unparse_block(node.body, indent)
         if node.orelse:
-            stmnt += f"\n{self.sep*indent}else:{self.unparse_block(node.orelse, indent)}"
-        return stmnt
-
-    def unparse_IfExp(self, node: ast.IfExp, indent: int = 0) -> str:
-        return (
-            f"{self.sep*indent}{self.unparse(node.body)}{self.space_before_kw(node.body)}"
-            f"if{self.space_after_kw(node.test)}{self.unparse(node.test)}"
-            f"{self.space_after_kw(node.test)}else"
-            f"{self.space_after_kw(node.orelse)}{self.unparse(node.orelse)}"
-        )
-
-    def unparse_Import(self, node: ast.Import, indent: int = 0) -> str:
-        return f"{self.sep*indent}import {','.join(map(self.unparse_alias_import, node.names))}"
-
-    def unparse_ImportFrom(self, node: ast.ImportFrom, indent: int = 0) -> str:
-        return (
+            self._write(f"\n{self.sep*indent}else:")
+            yield from self._unparse_block(node.orelse, indent)
+
+    def _unparse_IfExp(self, node: ast.IfExp, indent: int = 0) -> Iterator[_Child]:
+        self._write(self.sep * indent)
+        yield node.body
+        self._write_space_before_kw()
+        self._write("if")
+        test_start: int = (yield from self._write_node_after_kw(node.test))
+        self._write_space_after_kw(self._first_character(test_start))
+        self._write("else")
+        yield from self._write_node_after_kw(node.orelse)
+
+    def _unparse_Import(self, node: ast.Import, indent: int = 0) -> None:
+        self._write(f"{self.sep*indent}import {','.join(map(self.unparse_alias_import, node.names))}")
+
+    def _unparse_ImportFrom(self, node: ast.ImportFrom, indent: int = 0) -> None:
+        self._write(
             f"{self.sep*indent}from "
             f"{'.'*node.level if node.level is not None else ''}{node.modname} "
             f"import {','.join(map(self.unparse_alias_import, node.names))}"
         )
 
-    def unparse_Index(self, node: ast.Index, indent: int = 0) -> str:
-        return self.unparse(node.value)
+    def _unparse_Index(self, node: ast.Index, indent: int = 0) -> Iterator[_Child]:
+        yield node.value
 
-    def unparse_JoinedStr(self, node: ast.JoinedStr, indent: int = 0) -> str:
-        unparsed_values: List[str] = list(map(lambda x: self.unparse(x).strip("'"), node.values))
+    def _unparse_JoinedStr(self, node: ast.JoinedStr, indent: int = 0) -> Iterator[_Child]:
+        unparsed_values: List[str] = []
+        for value in node.values:
+            unparsed_values.append((yield from self._unparsed(value)).strip("'"))
         quotes = "'''" if any("\n" in x for x in unparsed_values) else "'"
-        return f"{self.sep*indent}f{quotes}{''.join(unparsed_values)}{quotes}"
-
-    def unparse_Keyword(self, node: ast.Keyword, indent: int = 0) -> str:
-        return f"{node.arg}={self.unparse(node.value)}"
-
-    def unparse_Lambda(self, node: ast.Lambda, indent: int = 0) -> str:
-        return f"{self.sep*indent}lambda {self.unparse(node.args)}:{self.unparse(node.body)}"
-
-    def unparse_List(self, node: ast.List, indent: int = 0) -> str:
-        return f"{self.sep*indent}[{','.join(map(self.unparse, node.elts))}]"
-
-    def unparse_ListComp(self, node: ast.ListComp, indent: int = 0) -> str:
-        return (
-            f"{self.sep*indent}[{self.unparse(node.elt)}{self.space_before_kw(node.elt)}"
-            f"{self.unparse_comprehension_generators(node.generators)}]"
-        )
-
-    def unparse_Module(self, node: ast.Module, indent: int = 0) -> str:
-        separator = "\n" if self.has_block(node.body) else ";"
-        return separator.join(map(self.unparse, node.body))
-
-    def unparse_Name(self, node: ast.Name, indent: int = 0) -> str:
-        return node.name  # type: ignore
-
-    def unparse_Nonlocal(self, node: ast.Nonlocal, indent: int = 0) -> str:
-        return f"{self.sep*indent}nonlocal {','.join(node.names)}"
-
-    def unparse_Pass(self, node: ast.Pass, indent: int = 0) -> str:
-        return "pass"
-
-    def unparse_Print(self, node: ast.Print, indent: int = 0) -> str:
+        self._write(f"{self.sep*indent}f{quotes}{''.join(unparsed_values)}{quotes}")
+
+    def _unparse_Keyword(self, node: ast.Keyword, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{node.arg}=")
+        yield node.value
+
+    def _unparse_Lambda(self, node: ast.Lambda, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}lambda ")
+        yield node.args
+        self._write(":")
+        yield node.body
+
+    def _unparse_List(self, node: ast.List, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}[")
+        yield from self._write_nodes(",", node.elts)
+        self._write("]")
+
+    def _unparse_ListComp(self, node: ast.ListComp, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}[")
+        yield node.elt
+        self._write_space_before_kw()
+        yield from self._unparse_comprehension_generators(node.generators)
+        self._write("]")
+
+    def _unparse_Module(self, node: ast.Module, indent: int = 0) -> Iterator[_Child]:
+        separator: str = "\n" if self.has_block(node.body) else ";"
+        for i, statement in enumerate(node.body):
+            if i != 0:
+                self._write(separator)
+            start: int = len(self.fragments)
+            yield statement
+            # Joins the fragments of each statement, the fragments of the whole module would take more memory than its code
+            self.fragments[start:] = ["".join(self.fragments[start:])]
+
+    def _unparse_Name(self, node: ast.Name, indent: int = 0) -> None:
+        self._write(node.name)
+
+    def _unparse_Nonlocal(self, node: ast.Nonlocal, indent: int = 0) -> None:
+        self._write(f"{self.sep*indent}nonlocal {','.join(node.names)}")
+
+    def _unparse_Pass(self, node: ast.Pass, indent: int = 0) -> None:
+        self._write("pass")
+
+    def _unparse_Print(self, node: ast.Print, indent: int = 0) -> None:
         raise Python2CodeDetected(node.__class__.__name__)
 
-    def unparse_Raise(self, node: ast.Raise, indent: int = 0) -> str:
-        stmnt = "raise"
+    def _unparse_Raise(self, node: ast.Raise, indent: int = 0) -> Iterator[_Child]:
+        self._write("raise")
         if node.exc is not None:
-            stmnt += f" {self.unparse(node.exc)}"
+            self._write(" ")
+            yield node.exc
         if node.cause is not None:
             if node.exc is None:
-                stmnt += " "
+                self._write(" ")
             else:
-                stmnt += self.space_before_kw(node.exc)
-            stmnt += f"from {self.unparse(node.cause)}"
-        return stmnt
+                self._write_space_before_kw()
+            self._write("from ")
+            yield node.cause
 
-    def unparse_Repr(self, node: ast.Repr, indent: int = 0) -> str:
+    def _unparse_Repr(self, node: ast.Repr, indent: int = 0) -> None:
         raise Python2CodeDetected(node.__class__.__name__)
 
-    def unparse_Return(self, node: ast.Return, indent: int = 0) -> str:
+    def _unparse_Return(self, node: ast.Return, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}return")
         if node.value is not None:
-            return f"{self.sep*indent}return{self.space_after_kw(node.value)}{self.unparse(node.value)}"
-        return f"{self.sep*indent}return"
+            yield from self._write_node_after_kw(node.value)
 
-    def unparse_Set(self, node: ast.Set, indent: int = 0) -> str:
-        return f"{self.sep*indent}{{{','.join(map(self.unparse, node.elts))}}}"
+    def _unparse_Set(self, node: ast.Set, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}{{")
+        yield from self._write_nodes(",", node.elts)
+        self._write("}")
 
-    def unparse_SetComp(self, node: ast.SetComp, indent: int = 0) -> str:
-        return (
-            f"{self.sep*indent}{{{self.unparse(node.elt)}{self.space_before_kw(node.elt)}"
-            f"{self.unparse_comprehension_generators(node.generators)}}}"
-        )
-
-    def unparse_Slice(self, node: ast.Slice, indent: int = 0) -> str:
-        stmnt = ""
+    def _unparse_SetComp(self, node: ast.SetComp, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}{{")
+        yield node.elt
+        self._write_space_before_kw()
+        yield from self._unparse_comprehension_generators(node.generators)
+        self._write("}")
 
+    def _unparse_Slice(self, node: ast.Slice, indent: int = 0) -> Iterator[_Child]:
         if node.lower is not None:
-            stmnt += self.unparse(node.lower)
-        stmnt += ":"
+            yield node.lower
+        self._write(":")
 
         if node.upper is not None:
-            stmnt += self.unparse(node.upper)
+            yield node.upper
         if node.step is not None:
-            stmnt += ":" + self.unparse(node.step)
-
-        return stmnt
-
-    def unparse_Starred(self, node: ast.Starred, indent: int = 0) -> str:
-        return f"*{self.unparse(node.value)}"
-
-    def unparse_Subscript(self, node: ast.Subscript, indent: int = 0) -> str:
-        return f"{self.sep*indent}{self.unparse(node.value)}[{self.unparse(node.slice)}]"
-
-    def unparse_TryExcept(self, node: ast.TryExcept, indent: int = 0) -> str:
-        stmnt = f"{self.sep*indent}try:{self.unparse_block(node.body)}\n"
-        stmnt += "\n".join(map(lambda handler: self.unparse(handler, indent), node.handlers))
+            self._write(":")
+            yield node.step
+
+    def _unparse_Starred(self, node: ast.Starred, indent: int = 0) -> Iterator[_Child]:
+        self._write("*")
+        yield node.value
+
+    def _unparse_Subscript(self, node: ast.Subscript, indent: int = 0) -> Iterator[_Child]:
+        self._write(self.sep * indent)
+        yield node.value
+        self._write("[")
+        yield node.slice
+        self._write("]")
+
+    def _unparse_TryExcept(self, node: ast.TryExcept, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}try:")
+        yield from self._unparse_block(node.body)
+        self._write("\n")
+        yield from self._write_nodes("\n", node.handlers, indent)
         if node.orelse:
-            return f"{stmnt}\nelse:{self.unparse_block(node.orelse)}"
-        return stmnt
+            self._write("\nelse:")
+            yield from self._unparse_block(node.orelse)
 
-    def unparse_TryFinally(self, node: ast.TryFinally, indent: int = 0) -> str:
-        stmnt = f"{self.sep*indent}try:{self.unparse_block(node.body)}"
+    def _unparse_TryFinally(self, node: ast.TryFinally, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}try:")
+        yield from self._unparse_block(node.body)
         if node.finalbody:
-            return f"{stmnt}\n{self.sep*indent}finally:{self.unparse_block(node.finalbody)}"
-        return stmnt
+            self._write(f"\n{self.sep*indent}finally:")
+            yield from self._unparse_block(node.finalbody)
 
-    def unparse_Tuple(self, node: ast.Tuple, indent: int = 0) -> str:
-        core: str = f"{self.sep*indent}{','.join(map(self.unparse, node.elts))}"
+    def _unparse_Tuple(self, node: ast.Tuple, indent: int = 0) -> Iterator[_Child]:
         if isinstance(node.parent, ast.Compare):
-            return f"({core})"
-        return self.sep * indent + core
-
-    def unparse_UnaryOp(self, node: ast.UnaryOp, indent: int = 0) -> str:
-        return (
-            f"{self.sep*indent}{node.op}"
-            f"{' ' if node.op == 'not' and not self._can_follow_reserved_keywords(node.operand) else ''}"
-            f"{self.unparse(node.operand)}"
-        )
+            self._write(f"({self.sep*indent}")
+            yield from self._write_nodes(",", node.elts)
+            self._write(")")
+        else:
+            self._write(self.sep * indent * 2)
+            yield from self._write_nodes(",", node.elts)
+
+    def _unparse_UnaryOp(self, node: ast.UnaryOp, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}{node.op}")
+        if node.op == "not":
+            yield from self._write_node_after_kw(node.operand)
+        else:
+            yield node.operand
 
-    def unparse_Unknown(self, node: ast.Unknown, indent: int = 0) -> str:
+    def _unparse_Unknown(self, node: ast.Unknown, indent: int = 0) -> None:
         pass
 
-    def unparse_While(self, node: ast.While, indent: int = 0) -> str:
-        stmnt = f"{self.sep*indent}while {self.unparse(node.test)}:" + self.unparse_block(node.body, indent)
+    def _unparse_While(self, node: ast.While, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}while ")
+        yield node.test
+        self._write(":")
+        yield from self._unparse_block(node.body, indent)
 
         if node.orelse:
-            stmnt += f"\n{self.sep*indent}else:{self.unparse_block(node.orelse, indent)}"
+            self._write(f"\n{self.sep*indent}else:")
+            yield from self._unparse_block(node.orelse, indent)
 
-        return stmnt
+    def _unparse_With(self, node: ast.With, indent: int = 0) -> Iterator[_Child]:
+        return self._unparse_with(node, False, indent)
 
-    def unparse_With(self, node: ast.With, indent: int = 0) -> str:
-        return self.unparse_with(node, False, indent)
+    def _unparse_Yield(self, node: ast.Yield, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}yield ")
+        yield node.value
 
-    def unparse_Yield(self, node: ast.Yield, indent: int = 0) -> str:
-        return f"{self.sep*indent}yield {self.unparse(node.value)}"
+    def _unparse_YieldFrom(self, node: ast.YieldFrom, indent: int = 0) -> Iterator[_Child]:
+        self._write(f"{self.sep*indent}yield from ")
+        yield node.value
 
-    def unparse_YieldFrom(self, node: ast.YieldFrom, indent: int = 0) -> str:
-        return f"{self.sep*indent}yield from {self.unparse(node.value)}"
+    def _can_follow_reserved_keywords(self, first_character: str) -> bool:
+        return self.should_remove_spaces_between_keywords and first_character != "" and first_character in "'\"({["
 
-    def space_after_kw(self, node):
-        return "" if self._can_follow_reserved_keywords(node) else " "
+    def _can_be_before_reserved_keywords(self, last_character: str) -> bool:
+        return self.should_remove_spaces_between_keywords and last_character != "" and last_character in "'\")}]0123456789"
 
-    def space_before_kw(self, node):
-        return "" if self._can_be_before_reserved_keywords(node) else " "
+    def has_block(self, block: List[NodeNG]) -> bool:
+        return any(node.__class__ in _block_classes for node in block)
 
-    def _can_follow_reserved_keywords(self, node):
-        if not self.should_remove_spaces_between_keywords:
-            return False
-        unparsed = self.unparse(node)
-        return isinstance(unparsed, str) and unparsed[0] in "'\"({["
 
-    def _can_be_before_reserved_keywords(self, node):
-        if not self.should_remove_spaces_between_keywords:
-            return False
-        unparsed = self.unparse(node)
-        return isinstance(unparsed, str) and unparsed[-1] in "'\")}]0123456789"
-
-    def has_block(self, block):
-        def is_block(node):
-            return node.__class__ in [
-                ast.AsyncFor,
-                ast.AsyncFunctionDef,
-                ast.AsyncWith,
-                ast.ClassDef,
-                ast.FunctionDef,
-                ast.For,
-                ast.If,
-                ast.TryExcept,
-                ast.TryFinally,
-                ast.With,
-                ast.While,
-            ]
-
-        return any(is_block(node) for node in block)
+def _unparse_into_string(writer_name: str) -> Callable[..., str]:
+    def unparse(self: Unparser, *args: Any) -> str:
+        return self._collect(getattr(self, writer_name), *args)
+
+    unparse.__name__ = unparse.__qualname__ = writer_name[1:]
+    return unparse
+
+
+Unparser._build_writers()
@@ -0,0 +1,438 @@
+import builtins
+import os
+import sys
+import time
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import astroid as ast
+from astroid.node_classes import NodeNG
+
+sys.path.append(os.path.join(os.getcwd()))
+from pygolf.backends import AstroidBackend, ParseBackend, StdlibBackend
+from pygolf.beam_search import BeamSearch
+from pygolf.helper import walker
+from pygolf.helper.node_index import NodeIndex
+from pygolf.name_finder import NameFinder
+from pygolf.optimizers.assign_name_optimizer import AssignNameOptimizer
+from pygolf.optimizers.batch_optimizer import BatchOptimizer
+from pygolf.optimizers.optimizer import Optimizer
+from pygolf.pygolfer import Pygolfer
+from pygolf.optimization_phases import AlwaysApplyPhase
+from pygolf.rules import (
+    AstroidRule,
+    DefineRenameCall,
+    RangeForToComprehensionFor,
+    RenameAssignName,
+    RenameCall,
+    RenameIdentifiers,
+    RenameName,
+    RuleRegistry,
+)
+from pygolf.unparser import Unparser
+
+examples_path = os.path.join(os.getcwd(), "code_example")
+
+
+def example_codes() -> Dict[str, str]:
+    codes: Dict[str, str] = {}
+    for file in sorted(os.listdir(examples_path)):
+        if file.endswith(".py") and not file.endswith("_shorten.py"):
+            with open(os.path.join(examples_path, file)) as fp:
+                codes[file.split(".")[0]] = fp.read()
+    return codes
+
+
+def synthetic_module(functions: int) -> str:
+    """Generates `functions` golf-like functions, sharing their local names."""
+    return "".join(
+        f"""
+def function_{i}(argument, other=3):
+    values = [argument * k for k in range(other) if k % 2]
+    total = 0
+    for value in values:
+        if value > {i} and value < 100 or not value:
+            total += value
+        else:
+            total -= len(str(value))
+    print('{{}} {{}}'.format(total, argument))
+    return total
+"""
+        for i in range(functions)
+    )
+
+
+def nested_range_loops(depth: int, statements: int) -> str:
+    """Generates `depth` nested range loops, each one with `statements` statements not using its target."""
+    return "".join(
+        " " * level + f"for i{level} in range(n):\n" + "".join(" " * (level + 1) + "print(n)\n" for _ in range(statements))
+        for level in range(depth)
+    )
+
+
+def distinct_names_module(functions: int) -> str:
+    """Generates `functions` functions, with 3 identifiers of their own each."""
+    return "".join(
+        f"""
+def function_{i}(argument_{i}):
+    result_{i} = argument_{i} * 2
+    return print(result_{i}, argument_{i})
+"""
+        for i in range(functions)
+    )
+
+
+def assignments_module(identifiers: int, in_function: bool) -> str:
+    """Generates the assignments of `identifiers` identifiers, at the top level or in a single function."""
+    indent: str = " " if in_function else ""
+    return ("def function():\n" if in_function else "") + "".join(
+        f"{indent}identifier_{i} = {i}\n" for i in range(identifiers)
+    )
+
+
+def synthetic_codes() -> Dict[str, str]:
+    return {f"synthetic_{functions}_functions": synthetic_module(functions) for functions in (10, 100, 1000)}
+
+
+def bool_op_chain(depth: int) -> NodeNG:
+    """Builds `a and (a and (... and a))` with `depth` operations, deeper than the python parser accepts."""
+    node: NodeNG = ast.Name(name="a")
+    for _ in range(depth):
+        bool_op = ast.BoolOp(op="and")
+        node.parent = bool_op
+        bool_op.postinit([ast.Name(name="a", parent=bool_op), node])
+        node = bool_op
+    return node
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    times: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def milliseconds(function: Callable[[], object], repeat: int) -> str:
+    return f"{best_time(function, repeat) * 1000:.2f}"
+
+
+def to_markdown_line(line: Iterable[str]) -> str:
+    return "| " + " | ".join(line) + " |"
+
+
+def print_table(header: Sequence[str], lines: Iterable[Sequence[str]]) -> None:
+    print(to_markdown_line(header))
+    print(to_markdown_line(["---"] * len(header)))
+    for line in lines:
+        print(to_markdown_line(line))
+
+
+def benchmark_backends(arguments: Namespace) -> None:
+    backends: List[ParseBackend] = [AstroidBackend(), StdlibBackend()]
+    pygolfer = Pygolfer()
+    lines: List[List[str]] = []
+    for name, code in {**example_codes(), **synthetic_codes()}.items():
+        line = [name, str(len(code))]
+        for backend in backends:
+            line.append(milliseconds(lambda: backend.parse(code), arguments.repeat))
+        for backend in backends:
+            line.append(milliseconds(lambda: pygolfer.shorten(code, backend=backend), arguments.repeat))
+        lines.append(line)
+
+    print_table(
+        ["code", "length"]
+        + [f"parse {backend!r} (ms)" for backend in backends]
+        + [f"shorten {backend!r} (ms)" for backend in backends],
+        lines,
+    )
+
+
+def benchmark_unparser(arguments: Namespace) -> None:
+    lines: List[List[str]] = []
+    for depth in (10, 100, 1000, 10000, 100000):
+        node = bool_op_chain(depth)
+        duration = best_time(lambda: Unparser().unparse(node), arguments.repeat)
+        lines.append([str(depth), f"{duration * 1000:.2f}", f"{duration / depth * 1e6:.2f}"])
+
+    print_table(["bool op chain depth", "unparse (ms)", "unparse per operation (µs)"], lines)
+    print()
+
+    lines = []
+    for name, code in synthetic_codes().items():
+        module = ast.parse(code)
+        line = [name, str(len(code)), milliseconds(lambda: Unparser().unparse(module), arguments.repeat)]
+        tracemalloc.start()
+        Unparser().unparse(module)
+        line.append(f"{tracemalloc.get_traced_memory()[1] / 1000:.0f}")
+        tracemalloc.stop()
+        lines.append(line)
+
+    print_table(["code", "length", "unparse (ms)", "unparse peak memory (kB)"], lines)
+
+
+def benchmark_length(arguments: Namespace) -> None:
+    lines: List[List[str]] = []
+    for name, code in synthetic_codes().items():
+        module = ast.parse(code)
+        unparser = Unparser()
+        unparser.unparse_length(module)
+
+        def measure_candidate() -> int:
+            # Candidate rewrite of the module, sharing all its statements but the last one
+            candidate = ast.Module(name=module.name, doc=None)
+            candidate.postinit(body=module.body[:-1] + [ast.Pass()])
+            return unparser.unparse_length(candidate)
+
+        lines.append(
+            [
+                name,
+                milliseconds(lambda: len(Unparser().unparse(module)), arguments.repeat),
+                milliseconds(lambda: Unparser().unparse_length(module), arguments.repeat),
+                milliseconds(measure_candidate, arguments.repeat),
+            ]
+        )
+
+    print_table(["code", "len(unparse) (ms)", "unparse_length (ms)", "unparse_length of a candidate (ms)"], lines)
+
+
+def benchmark_walker(arguments: Namespace) -> None:
+    lines: List[List[str]] = []
+    for name, code in synthetic_codes().items():
+        module = ast.parse(code)
+        lines.append(
+            [
+                name,
+                milliseconds(lambda: sum(1 for _ in walker.walk(module)), arguments.repeat),
+                milliseconds(lambda: sum(1 for _ in walker.walk(module, only=ast.Name)), arguments.repeat),
+                milliseconds(lambda: BatchOptimizer(NameFinder()).visit(module), arguments.repeat),
+            ]
+        )
+
+    print_table(["code", "walk (ms)", "walk only names (ms)", "BatchOptimizer.visit (ms)"], lines)
+
+
+def benchmark_index(arguments: Namespace) -> None:
+    codes: Dict[str, str] = synthetic_codes()
+    for depth in (10, 50, 90):
+        codes[f"nested_{depth}_range_loops"] = nested_range_loops(depth, 10)
+
+    lines: List[List[str]] = []
+    for name, code in codes.items():
+        module = ast.parse(code)
+        for_nodes: List[NodeNG] = list(module.nodes_of_class(ast.For))
+        range_for = RangeForToComprehensionFor()
+        define_rename_calls = [DefineRenameCall(method, method[:1]) for method in ("print", "range", "len", "str", "int")]
+
+        def evaluate_predicates(index: Optional[NodeIndex]) -> None:
+            for rule in [range_for, *define_rename_calls]:
+                rule.index = index
+            for node in for_nodes:
+                range_for.predicate(node)
+            for rule in define_rename_calls:
+                rule.predicate(module)
+
+        lines.append(
+            [
+                name,
+                milliseconds(lambda: evaluate_predicates(None), arguments.repeat),
+                milliseconds(lambda: evaluate_predicates(NodeIndex(module)), arguments.repeat),
+            ]
+        )
+
+    print_table(["code", "predicates walking (ms)", "predicates with an index, built (ms)"], lines)
+
+
+def renaming_rules(module: NodeNG) -> List[AstroidRule]:
+    """Rules of the always applied phase, and rules renaming every assigned name and every builtin called in `module`."""
+    rules: List[AstroidRule] = list(AlwaysApplyPhase().generate_rules(module))
+    assigned_names: Set[str] = {node.name for node in module.nodes_of_class(ast.AssignName)}
+    for i, name in enumerate(sorted(assigned_names)):
+        rules += [RenameAssignName(name, f"n{i}"), RenameName(name, f"n{i}")]
+    called_names: Set[str] = {node.func.name for node in module.nodes_of_class(ast.Call) if isinstance(node.func, ast.Name)}
+    for i, name in enumerate(sorted(called_names & set(dir(builtins)))):
+        rules.append(RenameCall(name, f"b{i}"))
+    return rules
+
+
+def benchmark_rules(arguments: Namespace) -> None:
+    lines: List[List[str]] = []
+    for name, code in synthetic_codes().items():
+        times: List[float] = []
+        for _ in range(arguments.repeat):
+            module = ast.parse(code)
+            registry = RuleRegistry()
+            rules = renaming_rules(module)
+            for rule in rules:
+                registry.register_rule(rule)
+            start = time.perf_counter()
+            registry.visit(module)
+            times.append(time.perf_counter() - start)
+        lines.append([name, str(len(rules)), f"{min(times) * 1000:.2f}"])
+
+    print_table(["code", "rules", "RuleRegistry.visit (ms)"], lines)
+
+
+def benchmark_rename(arguments: Namespace) -> None:
+    def visit_time(code: str, rules: Callable[[Dict[str, str]], List[AstroidRule]]) -> str:
+        times: List[float] = []
+        for _ in range(arguments.repeat):
+            module = ast.parse(code)
+            renames = {
+                name: f"n{i}" for i, name in enumerate(sorted({node.name for node in module.nodes_of_class(ast.AssignName)}))
+            }
+            registry = RuleRegistry()
+            for rule in rules(renames):
+                registry.register_rule(rule)
+            start = time.perf_counter()
+            registry.visit(module)
+            times.append(time.perf_counter() - start)
+        return f"{min(times) * 1000:.2f}"
+
+    def rule_pairs(renames: Dict[str, str]) -> List[AstroidRule]:
+        return [rule for old, new in renames.items() for rule in (RenameAssignName(old, new), RenameName(old, new))]
+
+    lines: List[List[str]] = []
+    for functions in (10, 100, 300):
+        code = distinct_names_module(functions)
+        lines.append(
+            [str(functions * 3), visit_time(code, rule_pairs), visit_time(code, lambda renames: [RenameIdentifiers(renames)]),]
+        )
+
+    print_table(["distinct identifiers", "RenameAssignName and RenameName pairs (ms)", "RenameIdentifiers (ms)"], lines)
+
+
+def benchmark_allocator(arguments: Namespace) -> None:
+    def analyze(module: ast.Module) -> Dict[str, str]:
+        optimizer = AssignNameOptimizer(NameFinder())
+        for node in walker.walk(module, only=(ast.Name, ast.AssignName)):
+            optimizer.visit(node)
+        rules = list(optimizer.generate_rules())
+        return rules[0].renames if rules else {}
+
+    modules: Dict[str, Callable[[int], str]] = {
+        "sibling functions": lambda identifiers: distinct_names_module(identifiers // 3),
+        "module": lambda identifiers: assignments_module(identifiers, in_function=False),
+        "single function": lambda identifiers: assignments_module(identifiers, in_function=True),
+    }
+    lines: List[List[str]] = []
+    for scopes, generate_module in modules.items():
+        for identifiers in (1000, 10000, 100000):
+            module = ast.parse(generate_module(identifiers))
+            renames: Dict[str, str] = analyze(module)
+            lines.append(
+                [
+                    scopes,
+                    str(identifiers),
+                    milliseconds(lambda: analyze(module), arguments.repeat),
+                    str(len(renames)),
+                    str(len(set(renames.values()))),
+                ]
+            )
+
+    print_table(["scopes", "identifiers", "AssignNameOptimizer (ms)", "renamed identifiers", "distinct names given"], lines)
+
+
+def benchmark_search(arguments: Namespace) -> None:
+    codes: Dict[str, str] = example_codes()
+    codes["synthetic_10_functions"] = synthetic_module(10)
+    lines: List[List[str]] = []
+    for width in (1, 4, 16):
+        for name, code in codes.items():
+            search = BeamSearch(width, time_budget=10)
+            shortened_code: str = search.shorten(code)
+            lines.append(
+                [
+                    name,
+                    str(width),
+                    str(len(Pygolfer().shorten(code))),
+                    str(len(shortened_code)),
+                    str(search.explored),
+                    f"{search.nodes_per_second():.0f}",
+                ]
+            )
+
+    print_table(["code", "width", "Pygolfer length", "BeamSearch length", "codes explored", "codes per second"], lines)
+
+
+class LambdaOptimizer(Optimizer):
+    """Optimizer of the lambdas, which the synthetic modules have none of."""
+
+    def merge(self, other: Optimizer) -> None:
+        pass
+
+    def generate_rules(self) -> Iterator[AstroidRule]:
+        return iter(())
+
+    def visit_Lambda(self, node: ast.Lambda) -> None:
+        pass
+
+
+def benchmark_dispatch(arguments: Namespace) -> None:
+    module = ast.parse(synthetic_module(100))
+    nodes: List[NodeNG] = list(module.nodes_of_class(NodeNG))
+    names: List[NodeNG] = [node for node in nodes if isinstance(node, ast.Name)]
+    optimizers: List[Optimizer] = BatchOptimizer(NameFinder()).optimizers
+    unparser = Unparser()
+
+    def visit_nodes(optimizer: Optimizer) -> None:
+        for node in nodes:
+            optimizer.visit(node)
+
+    def write_names() -> None:
+        for node in names:
+            unparser._write_node(node)
+        unparser.fragments.clear()
+
+    calls: Dict[str, Tuple[Callable[[], object], int]] = {
+        f"{optimizer.__class__.__name__}.visit": ((lambda optimizer=optimizer: visit_nodes(optimizer)), len(nodes))
+        for optimizer in optimizers
+    }
+    batch_optimizer = BatchOptimizer(NameFinder())
+    calls["BatchOptimizer.visit"] = ((lambda: batch_optimizer.visit(module)), len(nodes))
+    crowded_batch_optimizer = BatchOptimizer(NameFinder())
+    for _ in range(10):
+        crowded_batch_optimizer.add_optimizer(LambdaOptimizer())
+    calls["BatchOptimizer.visit with 10 more optimizers"] = ((lambda: crowded_batch_optimizer.visit(module)), len(nodes))
+    calls["Unparser._write_node(Name)"] = (write_names, len(names))
+    calls["Unparser.unparse(Module)"] = ((lambda: unparser.unparse(module)), len(nodes))
+
+    print_table(
+        ["call", "nodes", "per node (ns)"],
+        [
+            [call, str(count), f"{best_time(function, arguments.repeat) / count * 1e9:.0f}"]
+            for call, (function, count) in calls.items()
+        ],
+    )
+
+
+benchmarks: Dict[str, Callable[[Namespace], None]] = {
+    "allocator": benchmark_allocator,
+    "backends": benchmark_backends,
+    "dispatch": benchmark_dispatch,
+    "index": benchmark_index,
+    "length": benchmark_length,
+    "rename": benchmark_rename,
+    "rules": benchmark_rules,
+    "search": benchmark_search,
+    "unparser": benchmark_unparser,
+    "walker": benchmark_walker,
+}
+
+
+def parse_arguments(argv: Optional[Sequence[str]] = None) -> Namespace:
+    parser: ArgumentParser = ArgumentParser(description="Benchmarks PyGolf")
+    parser.add_argument("benchmark", help="Benchmark to run", choices=list(benchmarks))
+    parser.add_argument("-r", "--repeat", help="Number of runs, the best time is kept", type=int, default=5)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    arguments = parse_arguments(argv)
+    benchmarks[arguments.benchmark](arguments)
+
+
+if __name__ == "__main__":
+    main()
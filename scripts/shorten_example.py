@@ -5,6 +5,7 @@ from argparse import ArgumentParser, Namespace
 from typing import List, Optional, Sequence, Iterable
 
 sys.path.append(os.path.join(os.getcwd()))
+from pygolf.cache import SQLiteCache
 from pygolf.pygolfer import Pygolfer
 
 
@@ -50,6 +51,7 @@ def parse_arguments(argv: Optional[Sequence[str]] = None) -> Namespace:
     action_input.add_argument(
         "-g", "--generate", help="Generate shorten_code of examples in folder `code_example`", action="store_true",
     )
+    parser.add_argument("--cache", help="Reuse the codes shortened previously, stored in the given sqlite file", type=str)
     return parser.parse_args(argv)
 
 
@@ -62,7 +64,7 @@ def main(argv: Optional[Sequence[str]] = None):
     examples_path = os.path.join(os.getcwd(), "code_example")
     statistics_path = os.path.join(examples_path, "README.md")
     examples: List[Example] = []
-    pygolfer = Pygolfer()
+    pygolfer = Pygolfer(cache=SQLiteCache(arguments.cache) if arguments.cache is not None else None)
 
     for file in sorted(os.listdir(examples_path)):
 
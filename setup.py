@@ -1,3 +1,4 @@
+import re
 from os import path
 
 from setuptools import find_packages, setup
@@ -7,9 +8,12 @@ here = path.abspath(path.dirname(__file__))
 with open(path.join(here, "README.md"), encoding="utf-8") as f:
     long_description = f.read()
 
+with open(path.join(here, "pygolf", "__init__.py"), encoding="utf-8") as f:
+    version = re.search('__version__: str = "(.*)"', f.read()).group(1)
+
 setup(
     name="pygolf",
-    version="1.0.2",
+    version=version,
     description="An automatic python code shortener",
     long_description=long_description,
     long_description_content_type="text/markdown",
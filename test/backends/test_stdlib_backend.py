@@ -0,0 +1,18 @@
+from unittest import TestCase
+
+from astroid import AstroidSyntaxError
+
+from pygolf.backends import AstroidBackend, StdlibBackend
+from pygolf.unparser import Unparser
+
+unparser = Unparser()
+
+
+class TestStdlibBackend(TestCase):
+    def test_parse(self):
+        code = "from os import *\nclass A:\n    def f(self, a: int = 2):\n        self.x = [a for b in c]\nprint(A)"
+        self.assertEqual(unparser.unparse(StdlibBackend().parse(code)), unparser.unparse(AstroidBackend().parse(code)))
+
+    def test_parse_invalid_code(self):
+        with self.assertRaises(AstroidSyntaxError):
+            StdlibBackend().parse("print(")
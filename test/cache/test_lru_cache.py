@@ -0,0 +1,50 @@
+import pickle
+from unittest import TestCase
+
+import pygolf
+from pygolf.cache import LRUCache, cache_key, code_version
+
+
+class TestLRUCache(TestCase):
+    def test_get_put(self):
+        cache = LRUCache()
+        self.assertIsNone(cache.get("key"))
+        cache.put("key", "value")
+        self.assertEqual(cache.get("key"), "value")
+        self.assertEqual((cache.hits, cache.misses, cache.evictions), (1, 1, 0))
+
+    def test_max_entries(self):
+        cache = LRUCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+        self.assertEqual(list(cache.entries), ["a", "c"])
+        self.assertEqual(cache.evictions, 1)
+
+    def test_max_bytes(self):
+        cache = LRUCache(max_entries=None, max_bytes=10)
+        cache.put("a", "1234")
+        cache.put("b", "1234")
+        self.assertEqual(cache.size, 10)
+        cache.put("c", "é")
+        self.assertEqual(list(cache.entries), ["b", "c"])
+        self.assertEqual(cache.size, 8)
+        cache.put("d", "0123456789")
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.evictions, 4)
+
+    def test_pickle(self):
+        cache = LRUCache(max_entries=3, max_bytes=100)
+        cache.put("a", "1")
+        copy = pickle.loads(pickle.dumps(cache))
+        self.assertEqual((copy.max_entries, copy.max_bytes, len(copy)), (3, 100, 0))
+
+    def test_cache_key(self):
+        self.assertEqual(cache_key("a=1", "[AlwaysApplyPhase]"), cache_key("a=1", "[AlwaysApplyPhase]"))
+        self.assertNotEqual(cache_key("a=1", "[AlwaysApplyPhase]"), cache_key("a=1", "[RenamePhase]"))
+        self.assertNotEqual(cache_key("a=1", "[AlwaysApplyPhase]"), cache_key("a=2", "[AlwaysApplyPhase]"))
+
+    def test_code_version(self):
+        self.assertTrue(code_version().startswith(pygolf.__version__ + "+"))
+        self.assertEqual(code_version(), code_version())
@@ -0,0 +1,64 @@
+import os
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase, mock
+
+import pygolf
+from pygolf.cache import SQLiteCache
+
+
+def fill_cache(cache: SQLiteCache, worker: int) -> int:
+    for i in range(50):
+        cache.put(f"{worker}-{i}", str(i))
+        cache.get(f"{worker}-{i // 2}")
+    return cache.hits
+
+
+class TestSQLiteCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache", "pygolf.sqlite3")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_get_put(self):
+        cache = SQLiteCache(self.path)
+        self.assertIsNone(cache.get("key"))
+        cache.put("key", "value")
+        cache.put("key", "other value")
+        self.assertEqual(cache.get("key"), "other value")
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 1, 1))
+
+        self.assertEqual(SQLiteCache(self.path).get("key"), "other value")
+
+    def test_eviction(self):
+        cache = SQLiteCache(self.path, max_entries=2, max_bytes=12)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+        self.assertEqual((cache.get("a"), cache.get("b"), cache.get("c")), ("1", None, "3"))
+
+        cache.put("d", "0123456789")
+        self.assertEqual((cache.get("c"), cache.get("d"), len(cache)), (None, "0123456789", 1))
+        self.assertEqual(cache.evictions, 3)
+
+    def test_version_invalidation(self):
+        SQLiteCache(self.path).put("key", "value")
+        with mock.patch.object(pygolf, "__version__", "0.0.0"):
+            self.assertIsNone(SQLiteCache(self.path).get("key"))
+
+    def test_sources_invalidation(self):
+        SQLiteCache(self.path).put("key", "value")
+        with mock.patch("pygolf.cache.sqlite_cache.code_version", return_value=f"{pygolf.__version__}+0"):
+            self.assertIsNone(SQLiteCache(self.path).get("key"))
+
+    def test_several_processes(self):
+        cache = SQLiteCache(self.path)
+        cache.put("key", "value")
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            hits = list(executor.map(fill_cache, [pickle.loads(pickle.dumps(cache))] * 8, range(8)))
+        self.assertEqual(hits, [50] * 8)
+        self.assertEqual(len(cache), 401)
@@ -0,0 +1,41 @@
+from unittest import TestCase
+
+import astroid
+from astroid.node_classes import NodeNG
+
+from pygolf.helper.node_index import NodeIndex
+from pygolf.unparser import Unparser
+
+unparser = Unparser()
+
+
+class TestNodeIndex(TestCase):
+    def test_nodes_of_class(self):
+        module = astroid.parse("f(a)\nfor b in c:g(b)")
+        index = NodeIndex(module)
+        self.assertEqual([call.func.name for call in index.nodes_of_class(astroid.Call)], ["f", "g"])
+        self.assertEqual(index.nodes_of_class(astroid.While), [])
+        self.assertIn(module.body[1], index)
+        self.assertNotIn(astroid.Name(name="b"), index)
+
+    def test_occurrences(self):
+        module = astroid.parse("a = 1\nfor b in a:\n    print(a, b)\nprint(a)")
+        index = NodeIndex(module)
+        self.assertEqual([node.__class__.__name__ for node in index.occurrences("a")], ["AssignName", "Name", "Name", "Name"])
+        self.assertEqual([node.lineno for node in index.occurrences("a", inside=module.body[1])], [2, 3])
+        self.assertEqual(index.occurrences("c"), [])
+
+    def test_copy(self):
+        module = astroid.parse("a = 1\nfor b in a:\n    print(a, [b])")
+        index = NodeIndex(module)
+        copy = index.copy()
+        self.assertIsNot(copy.tree, module)
+        self.assertEqual(unparser.unparse(copy.tree), unparser.unparse(module))
+        for node in copy.tree.nodes_of_class(NodeNG):
+            self.assertIn(node, copy)
+            self.assertNotIn(node, index)
+            self.assertTrue(node.parent is None or node.parent in copy)
+        self.assertEqual([node.lineno for node in copy.occurrences("a", inside=copy.tree.body[1])], [2, 3])
+
+        copy.tree.body[1].body = []
+        self.assertEqual(unparser.unparse(module), "a=1\nfor b in a:print(a,[b])")
@@ -0,0 +1,36 @@
+from unittest import TestCase
+
+import astroid
+
+from pygolf.helper import walker
+
+
+class TestWalker(TestCase):
+    def test_walk(self):
+        module = astroid.parse("with open(a) as f:print({b: c})")
+        self.assertEqual(
+            [node.__class__.__name__ for node in walker.walk(module)],
+            ["Module", "With", "Call", "Name", "Name", "AssignName", "Expr", "Call", "Name", "Dict", "Name", "Name"],
+        )
+
+    def test_walk_only(self):
+        module = astroid.parse("x = f(a, g(b))")
+        self.assertEqual([node.name for node in walker.walk(module, only=astroid.Name)], ["f", "a", "g", "b"])
+        self.assertEqual(
+            [node.__class__.__name__ for node in walker.walk(module, only=(astroid.AssignName, astroid.Call))],
+            ["AssignName", "Call", "Call"],
+        )
+
+    def test_walk_prune(self):
+        module = astroid.parse("def f():\n    a = 1\nb = [c for c in d]")
+        self.assertEqual(
+            [node.name for node in walker.walk(module, only=astroid.AssignName, prune=walker.is_expression)], ["a", "b"]
+        )
+
+    def test_walk_deeply_nested_code(self):
+        node = astroid.Name(name="a")
+        for _ in range(100000):
+            parent = astroid.UnaryOp(op="-")
+            parent.postinit(node)
+            node = parent
+        self.assertEqual(sum(1 for _ in walker.walk(node, only=astroid.Name)), 1)
@@ -0,0 +1,15 @@
+import os
+from typing import Iterator, Tuple
+
+examples_path: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "code_example")
+
+
+def code_examples() -> Iterator[Tuple[str, str]]:
+    """Yields the codes of the examples, with their shortened codes."""
+    for file in sorted(os.listdir(examples_path)):
+        if file.endswith(".py") and not file.endswith("_shorten.py"):
+            with open(os.path.join(examples_path, file)) as fp:
+                code = fp.read()
+            with open(os.path.join(examples_path, file.replace(".py", "_shorten.py"))) as fp:
+                expected = fp.read()
+            yield code, expected
@@ -4,7 +4,7 @@ import astroid
 
 from pygolf.name_finder import NameFinder
 from pygolf.optimizers.assign_name_optimizer import AssignNameOptimizer
-from pygolf.rules import RenameAssignName, RenameName
+from pygolf.rules import RenameIdentifiers
 
 
 class TestAssignNameOptimizer(TestCase):
@@ -13,7 +13,7 @@ class TestAssignNameOptimizer(TestCase):
         assign_name = astroid.extract_node("a=5").targets[0]
 
         assign_name_optimizer.visit(assign_name)
-        self.assertEqual(assign_name_optimizer.names, ["a"])
+        self.assertEqual(assign_name_optimizer.names, {"a": 1})
 
     def test_generate_rules(self):
         assign_name_optimizer = AssignNameOptimizer(NameFinder())
@@ -21,4 +21,21 @@ class TestAssignNameOptimizer(TestCase):
         assign_name_optimizer.visit(astroid.extract_node("long_name=3").targets[0])
         assign_name_optimizer.visit(astroid.extract_node("a=3").targets[0])
         rules = list(assign_name_optimizer.generate_rules())
-        self.assertEqual(rules, [RenameAssignName("long_name", next_name), RenameName("long_name", next_name)])
+        self.assertEqual(rules, [RenameIdentifiers({"long_name": next_name})])
+
+    def test_generate_rules_by_occurrences(self):
+        assign_name_optimizer = AssignNameOptimizer(NameFinder())
+        for node in astroid.parse("first_name=1\nsecond_name=2\nprint(second_name)").nodes_of_class(
+            (astroid.AssignName, astroid.Name)
+        ):
+            assign_name_optimizer.visit(node)
+        rules = list(assign_name_optimizer.generate_rules())
+        self.assertEqual(rules, [RenameIdentifiers({"second_name": "Z", "first_name": "Y"})])
+
+    def test_generate_rules_by_scopes(self):
+        assign_name_optimizer = AssignNameOptimizer(NameFinder())
+        module = astroid.parse("def f(first_name):return first_name\ndef g(second_name):return second_name")
+        for node in module.nodes_of_class((astroid.AssignName, astroid.Name)):
+            assign_name_optimizer.visit(node)
+        rules = list(assign_name_optimizer.generate_rules())
+        self.assertEqual(rules, [RenameIdentifiers({"first_name": "Z", "second_name": "Z"})])
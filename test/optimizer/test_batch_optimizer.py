@@ -0,0 +1,53 @@
+from typing import *
+from unittest import TestCase
+
+import astroid
+
+from pygolf.name_finder import NameFinder
+from pygolf.optimizers.batch_optimizer import BatchOptimizer
+from pygolf.optimizers.optimizer import Optimizer
+
+
+class LambdaOptimizer(Optimizer):
+    def __init__(self) -> None:
+        self.lambdas: List[astroid.Lambda] = []
+
+    def merge(self, other: Optimizer) -> None:
+        raise NotImplementedError
+
+    def generate_rules(self) -> Iterator:
+        return iter(())
+
+    def visit_Lambda(self, node: astroid.Lambda) -> None:
+        self.lambdas.append(node)
+
+    def visit_lambda_body(self, node: astroid.Lambda) -> None:
+        raise NotImplementedError
+
+
+class TestBatchOptimizer(TestCase):
+    def test_visit(self):
+        batch_optimizer = BatchOptimizer(NameFinder())
+        lambda_optimizer = LambdaOptimizer()
+        batch_optimizer.add_optimizer(lambda_optimizer)
+        self.assertEqual(
+            set(batch_optimizer.routes),
+            {
+                astroid.AssignName,
+                astroid.Name,
+                astroid.FunctionDef,
+                astroid.AsyncFunctionDef,
+                astroid.ClassDef,
+                astroid.Import,
+                astroid.ImportFrom,
+                astroid.Lambda,
+            },
+        )
+        self.assertEqual(list(lambda_optimizer.visitors()), [astroid.Lambda])
+
+        module = astroid.parse("f=lambda x:print(x)\nf(y)")
+        batch_optimizer.visit(module)
+        assign_name_optimizer, rename_method_optimizer = batch_optimizer.optimizers[:2]
+        self.assertEqual(assign_name_optimizer.names, {"f": 2, "x": 2, "print": 1, "y": 1})
+        self.assertEqual(rename_method_optimizer.standard_methods["print"], 1)
+        self.assertEqual(lambda_optimizer.lambdas, list(module.nodes_of_class(astroid.Lambda)))
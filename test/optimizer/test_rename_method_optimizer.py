@@ -2,20 +2,53 @@ from unittest import TestCase
 
 import astroid
 
+from pygolf.helper import walker
 from pygolf.name_finder import NameFinder
 from pygolf.optimizers.rename_method_optimizer import RenameMethodOptimizer
-from pygolf.rules import DefineRenameCall, RenameCall
+from pygolf.rules import DefineRenameCall, RenameIdentifiers
 
 
 class TestRenameMethodOptimizer(TestCase):
     def test_generate_rules(self):
         rename_method_optimizer = RenameMethodOptimizer(NameFinder())
         next_name = rename_method_optimizer.name_finder.next_name()
-        rename_method_optimizer.visit(astroid.extract_node("print(2)"))
-        rename_method_optimizer.visit(astroid.extract_node("print(2)"))
-        rename_method_optimizer.visit(astroid.extract_node("print(2)"))
-        rename_method_optimizer.visit(astroid.extract_node("print(2)"))
-        rename_method_optimizer.visit(astroid.extract_node("print(2)"))
-        rename_method_optimizer.visit(astroid.extract_node("input()"))
+        for node in astroid.parse("print(2)\n" * 5 + "input()").nodes_of_class(astroid.Name):
+            rename_method_optimizer.visit(node)
         rules = list(rename_method_optimizer.generate_rules())
-        self.assertEqual(rules, [RenameCall("print", next_name), DefineRenameCall("print", next_name)])
+        self.assertEqual(rules, [RenameIdentifiers({"print": next_name}), DefineRenameCall("print", next_name)])
+
+    def test_generate_rules_by_gain(self):
+        rename_method_optimizer = RenameMethodOptimizer(NameFinder())
+        module = astroid.parse("a=map(int,input().split())\n" * 4)
+        for node in module.nodes_of_class((astroid.Name, astroid.AssignName)):
+            rename_method_optimizer.visit(node)
+        rules = list(rename_method_optimizer.generate_rules())
+        self.assertEqual(rules[0], RenameIdentifiers({"input": "Z", "map": "Y", "int": "X"}))
+
+    def test_assigned_builtins(self):
+        rename_method_optimizer = RenameMethodOptimizer(NameFinder())
+        for node in astroid.parse("print=f\n" + "print(2)\n" * 5).nodes_of_class((astroid.Name, astroid.AssignName)):
+            rename_method_optimizer.visit(node)
+        self.assertEqual(list(rename_method_optimizer.generate_rules()), [])
+
+    def test_defined_builtins(self):
+        for definition in [
+            "def print(): pass",
+            "async def print(): pass",
+            "class print: pass",
+            "from m import join as print",
+            "from m import print",
+            "import print",
+            "import m as print",
+        ]:
+            rename_method_optimizer = RenameMethodOptimizer(NameFinder())
+            for node in walker.walk(astroid.parse(definition + "\n" + "print(2)\n" * 5)):
+                rename_method_optimizer.visit(node)
+            self.assertEqual(list(rename_method_optimizer.generate_rules()), [], definition)
+
+    def test_annotations(self):
+        rename_method_optimizer = RenameMethodOptimizer(NameFinder())
+        module = astroid.parse("def f(a: int, *b: int, c: int = int(d)) -> int:\n    e: int = int(a)")
+        for node in module.nodes_of_class(astroid.Name):
+            rename_method_optimizer.visit(node)
+        self.assertEqual(rename_method_optimizer.standard_methods, {"int": 2})
@@ -1,14 +1,10 @@
 from contextlib import contextmanager
 
-from astroid.transforms import TransformVisitor
-
-from pygolf.rules import AstroidRule
+from pygolf.rules import AstroidRule, RuleRegistry
 
 
 @contextmanager
 def register_rule(rule: AstroidRule) -> None:
-    transformer: TransformVisitor = TransformVisitor()
-    transformer.register_transform(
-        rule.on_node, rule.transform, rule.predicate,
-    )
-    yield transformer
+    registry: RuleRegistry = RuleRegistry()
+    registry.register_rule(rule)
+    yield registry
@@ -0,0 +1,50 @@
+import unittest
+
+import astroid
+
+from pygolf.rules import AstroidRule, ListAppend, RenameName, RuleRegistry
+from pygolf.unparser import Unparser
+
+unparser = Unparser()
+
+
+class RenameNameToCall(AstroidRule):
+    on_node = astroid.Name
+
+    def transform(self, node: astroid.Name) -> astroid.Call:
+        call = astroid.Call(parent=node.parent)
+        call.postinit(func=astroid.Name(name=node.name, parent=call), args=[], keywords=[])
+        return call
+
+    def predicate(self, node: astroid.Name) -> bool:
+        return node.name == "b"
+
+
+class TestRuleRegistry(unittest.TestCase):
+    def test_rules_order(self):
+        registry = RuleRegistry()
+        registry.register_rule(RenameName("a", "b"))
+        registry.register_rule(RenameNameToCall())
+        registry.register_rule(RenameName("b", "c"))
+        node = registry.visit(astroid.parse("a+b;l.append(a)"))
+        self.assertEqual(unparser.unparse(node), "b()+b();l.append(b())")
+
+    def test_rules_on_replaced_children(self):
+        registry = RuleRegistry()
+        registry.register_rule(RenameName("a", "b"))
+        registry.register_rule(ListAppend())
+        node = registry.visit(astroid.parse("with f(a) as g:l.append({a: [a, a]})"))
+        self.assertEqual(unparser.unparse(node), "with f(b) as g:l+=[{b:[b,b]}]")
+
+    def test_visit_deeply_nested_code(self):
+        node = astroid.Name(name="a")
+        for _ in range(100000):
+            parent = astroid.UnaryOp(op="-")
+            parent.postinit(node)
+            node = parent
+        registry = RuleRegistry()
+        registry.register_rule(RenameName("a", "b"))
+        node = registry.visit(node)
+        while isinstance(node, astroid.UnaryOp):
+            node = node.operand
+        self.assertEqual(node.name, "b")
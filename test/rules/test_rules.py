@@ -3,6 +3,7 @@ from test.rules.helper_testkit import register_rule
 
 import astroid
 
+from pygolf.helper.node_index import NodeIndex
 from pygolf.rules import *
 from pygolf.unparser import Unparser
 
@@ -32,6 +33,15 @@ class TestDefineRenameCall(unittest.TestCase):
             unparsed = unparser.unparse(node)
             self.assertEqual(unparsed, "new_method_name=method_name")
 
+    def test_rule_with_index(self):
+        rule = DefineRenameCall("method_name", "new_method_name")
+        node = astroid.parse("new_method_name=method_name")
+        rule.index = NodeIndex(node)
+        self.assertFalse(rule.predicate(node))
+        node = astroid.parse("new_method_name=other_method_name")
+        rule.index = NodeIndex(node)
+        self.assertTrue(rule.predicate(node))
+
 
 class TestFormatToFString(unittest.TestCase):
     def test_rule(self):
@@ -62,6 +72,14 @@ class TestRangeForToComprehensionFor(unittest.TestCase):
             node = transformer.visit(astroid.parse("for i in range(n):print('hello world')"))
             self.assertEqual(unparser.unparse(node), "for i in'|'*n:print('hello world')")
 
+    def test_rule_with_index(self):
+        node = astroid.parse("for i in range(n):\n    for j in range(i):l.append(j)\n    for k in range(i):pass")
+        registry = RuleRegistry(index=NodeIndex(node))
+        registry.register_rule(ListAppend())
+        registry.register_rule(RangeForToComprehensionFor())
+        node = registry.visit(node)
+        self.assertEqual(unparser.unparse(node), "for i in range(n):\n for j in range(i):l+=[j]\n for k in'|'*i:pass")
+
 
 class TestRenameAssign(unittest.TestCase):
     def test_rule(self):
@@ -77,6 +95,19 @@ class TestRenameCall(unittest.TestCase):
             self.assertEqual("new_method_name(2)", unparser.unparse(node))
 
 
+class TestRenameIdentifiers(unittest.TestCase):
+    def test_rule(self):
+        rule = RenameIdentifiers({"long_name": "a", "other_name": "b"})
+        with register_rule(rule) as transformer:
+            node = transformer.visit(astroid.parse("long_name, x = other_name\nprint(long_name, x)"))
+            self.assertEqual(unparser.unparse(node), "a,x=b;print(a,x)")
+
+    def test_restricted_to(self):
+        rule = RenameIdentifiers({"long_name": "a", "other_name": "b"})
+        self.assertEqual(rule.restricted_to({"other_name", "print"}), RenameIdentifiers({"other_name": "b"}))
+        self.assertEqual(rule.restricted_to(set()).on_node, ())
+
+
 class TestRenameName(unittest.TestCase):
     def test_rule(self):
         with register_rule(RenameName("long_name", "very_short_name")) as transformer:
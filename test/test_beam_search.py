@@ -0,0 +1,36 @@
+import unittest
+from test.helper_testkit import code_examples
+
+from pygolf.beam_search import BeamSearch
+from pygolf.optimization_phases import Phase
+from pygolf.pygolfer import Pygolfer
+from pygolf.rules import RenameIdentifiers
+
+
+class InvalidRenamePhase(Phase):
+    def generate_rules(self, ast, cancellation=None, index=None):
+        yield RenameIdentifiers({"long_name": "1"})
+
+
+class TestBeamSearch(unittest.TestCase):
+    def test_shorten(self):
+        search = BeamSearch(width=2)
+        code = "long_name = input()\nfor i in range(3):\n    print('{}'.format(long_name))\nl.append(long_name)"
+        self.assertEqual(search.shorten(code), "Z=input()\nfor i in'|'*3:print(f'{Z}')\nl+=[Z]")
+        self.assertGreater(search.explored, 0)
+        self.assertGreater(search.nodes_per_second(), 0)
+
+    def test_shorten_code_examples(self):
+        search = BeamSearch()
+        for code, expected in code_examples():
+            self.assertLessEqual(len(search.shorten(code)), len(expected))
+
+    def test_shorten_to_valid_code(self):
+        search = BeamSearch(phases=[InvalidRenamePhase()])
+        self.assertEqual(Pygolfer(phases=[InvalidRenamePhase()]).shorten("long_name = 2"), "1=2")
+        self.assertEqual(search.shorten("long_name = 2"), "long_name=2")
+
+    def test_shorten_after_time_budget(self):
+        search = BeamSearch(time_budget=0)
+        self.assertEqual(search.shorten("for i in range(2):\n    print( i )"), "for i in range(2):print(i)")
+        self.assertEqual(search.explored, 0)
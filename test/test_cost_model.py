@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+import astroid
+
+from pygolf.cost_model import CostModel, alias_gain, rename_gain
+from pygolf.helper.node_index import NodeIndex
+from pygolf.rules import *
+from pygolf.unparser import Unparser
+
+
+class ListAppendOnL(ListAppend):
+    """Saves characters when appending to `l` only."""
+
+    def gain(self, node, cost_model):
+        return 5 if node.func.expr.name == "l" else -2
+
+
+class TestCostModel(TestCase):
+    def test_rename_gain(self):
+        self.assertEqual(rename_gain("long_name", "Z", 3), 24)
+        self.assertEqual(rename_gain("a", "Z"), 0)
+
+    def test_alias_gain(self):
+        self.assertEqual(alias_gain("print", "Z", 2), 0)
+        self.assertEqual(alias_gain("print", "Z", 3), 4)
+
+    def test_rule_gain(self):
+        module = astroid.parse("l.append(2)\nfor i in range(n):l.append(i)\nfor i in range(1, n):print(i)")
+        cost_model = CostModel()
+        self.assertEqual(cost_model.rule_gain(ListAppend(), NodeIndex(module)), 10)
+        self.assertEqual(cost_model.rule_gain(RangeForToComprehensionFor(), NodeIndex(module)), 0)
+
+        module = astroid.parse("for i in range(n):print(2)\nfor i in range(1, n):print(3)")
+        self.assertEqual(cost_model.rule_gain(RangeForToComprehensionFor(), NodeIndex(module)), 6)
+        self.assertEqual(
+            len("for i in range(n):print(2)\nfor i in range(1,n):print(3)") - 6,
+            len("for i in'|'*n:print(2)\nfor i in'|'*(n-1):print(3)"),
+        )
+
+    def test_profitable_rules(self):
+        module = astroid.parse("l.append('{}'.format(a))")
+        rules = list(
+            CostModel().profitable_rules([FormatToFString(), RangeForToComprehensionFor(), ListAppend()], NodeIndex(module))
+        )
+        self.assertEqual(list(map(repr, rules)), ["FormatToFString", "ListAppend"])
+
+    def test_profitable_rules_skip_losing_nodes(self):
+        module = astroid.parse("l.append(1)\nm.append(2)")
+        index = NodeIndex(module)
+        registry = RuleRegistry(index=index)
+        for rule in CostModel().profitable_rules([ListAppendOnL()], index):
+            registry.register_rule(rule)
+        self.assertEqual(Unparser().unparse(registry.visit(module)), "l+=[1];m.append(2)")
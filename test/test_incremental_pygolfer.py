@@ -0,0 +1,52 @@
+import unittest
+from test.helper_testkit import code_examples
+from unittest import mock
+
+import astroid
+
+from pygolf.incremental_pygolfer import IncrementalPygolfer, _split_statements
+from pygolf.pygolfer import Pygolfer
+
+
+class TestIncrementalPygolfer(unittest.TestCase):
+    def test_shorten_code_examples(self):
+        pygolfer = IncrementalPygolfer()
+        for code, expected in code_examples():
+            self.assertEqual(pygolfer.shorten(code), expected)
+
+    def test_shorten_parses_changed_statements(self):
+        pygolfer = IncrementalPygolfer()
+        code = "long_name = input()\nprint(long_name)\nprint(long_name)\nprint(long_name)"
+        pygolfer.shorten(code)
+        with mock.patch.object(astroid, "parse", wraps=astroid.parse) as parse:
+            self.assertEqual(pygolfer.shorten(code), "Y=print;Z=input();Y(Z);Y(Z);Y(Z)")
+        self.assertEqual(parse.call_count, 0)
+
+        with mock.patch.object(astroid, "parse", wraps=astroid.parse) as parse:
+            shortened_code = pygolfer.shorten("long_name = input()\nprint(long_name)\nprint(long_name)\nprint(long_name, 2)")
+        self.assertEqual(shortened_code, "Y=print;Z=input();Y(Z);Y(Z);Y(Z,2)")
+        self.assertEqual(parse.call_count, 1)
+
+    def test_shorten_renames_as_pygolfer(self):
+        versions = [
+            "long_name = input()\nprint(long_name)",
+            "other_name = 1\nlong_name = input()\nprint(long_name)",
+            "other_name = 1\nlong_name = input()\nprint(long_name)\nprint(other_name)\nprint(1)\nprint(2)",
+            '"""docstring"""\nother_name = 1\n"string"\nprint(long_name)\nprint(1)\nprint(2)\nprint(3)\nZ = print',
+            "@decorator\ndef function(parameter):\n    return parameter\nfor i in range(3): print(function(i))",
+        ]
+        pygolfer = IncrementalPygolfer()
+        for code in versions:
+            self.assertEqual(pygolfer.shorten(code), Pygolfer().shorten(code))
+
+    def test_split_statements(self):
+        code = '"""doc"""\na = 1; b = (2,\n 3)  # c\n@d\ndef f(): return 1; g = 2\ntry:\n  pass\nexcept E: pass\nif x: y'
+        self.assertEqual(
+            _split_statements(code),
+            ["a = 1", "b = (2,\n 3)", "@d\ndef f(): return 1; g = 2", "try:\n  pass\nexcept E: pass", "if x: y"],
+        )
+        self.assertIsNone(_split_statements("print 2"))
+
+    def test_shorten_invalid_code(self):
+        with self.assertRaises(astroid.AstroidSyntaxError):
+            IncrementalPygolfer().shorten("print 2")
@@ -2,13 +2,28 @@ import argparse
 import tempfile
 import unittest
 
-from pygolf.__main__ import get_arguments_warning, read_input_code, shorten
+from pygolf.__main__ import get_arguments_warning, read_input_code, shorten, shorten_to_file
+from pygolf.beam_search import BeamSearch
 
 
 class TestMain(unittest.TestCase):
     def test_reduce(self):
         self.assertEqual(shorten("print( 1 + 2 )"), "print(1+2)")
         self.assertEqual(shorten("not valid code"), None)
+        self.assertEqual(shorten("print( 1 + 2 )", search=BeamSearch()), "print(1+2)")
+        self.assertEqual(shorten("not valid code", search=BeamSearch()), None)
+
+    def test_shorten_to_file(self):
+        with tempfile.NamedTemporaryFile("w+") as fp:
+            fp.write("previous content")
+            fp.flush()
+            self.assertEqual(shorten_to_file("not valid code", fp.name), None)
+            fp.seek(0)
+            self.assertEqual(fp.read(), "previous content")
+
+            self.assertEqual(shorten_to_file("for i in range(2):\n    print( i )\nx = 3", fp.name), 30)
+            with open(fp.name) as output:
+                self.assertEqual(output.read(), "for i in range(2):print(i)\nx=3")
 
     def test_read_input_code(self):
         name_space = argparse.Namespace()
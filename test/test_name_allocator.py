@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+import astroid
+
+from pygolf.name_allocator import NameAllocator, scope_of
+from pygolf.name_finder import NameFinder
+
+
+class TestNameAllocator(TestCase):
+    def test_allocate(self):
+        module = astroid.parse(
+            """
+module_name = 1
+def first_function():
+    first_name = 2
+    def nested_function():
+        nested_name = 3
+def second_function():
+    second_name = module_name
+"""
+        )
+        scopes = {}
+        for node in module.nodes_of_class((astroid.Name, astroid.AssignName)):
+            scopes.setdefault(node.name, set()).add(scope_of(node))
+
+        allocator = NameAllocator(NameFinder())
+        names = {identifier: allocator.allocate(identifier, scopes[identifier]) for identifier in scopes}
+        self.assertEqual(names, {"module_name": "Z", "first_name": "Y", "nested_name": "X", "second_name": "Y"})
+        self.assertEqual(allocator.names, ["Z", "Y", "X"])
+
+    def test_allocate_after_names_of_the_module(self):
+        module = astroid.parse("def first_function(): pass\ndef second_function(): pass")
+        first_function, second_function = module.body
+        allocator = NameAllocator(NameFinder())
+        names = [
+            allocator.allocate(identifier, scopes)
+            for identifier, scopes in [
+                ("first_a", [first_function]),
+                ("first_b", [first_function]),
+                ("second_a", [second_function]),
+                ("module_name", [None]),
+                ("second_b", [second_function]),
+                ("second_c", [second_function]),
+                ("first_c", [first_function]),
+            ]
+        ]
+        self.assertEqual(names, ["Z", "Y", "Z", "X", "Y", "W", "W"])
+
+    def test_allocate_shorter_names(self):
+        allocator = NameAllocator(NameFinder())
+        self.assertIsNone(allocator.allocate("a", [None]))
+        self.assertEqual(allocator.allocate("ab", [None]), "Z")
+        self.assertEqual(allocator.names, ["Z"])
@@ -0,0 +1,28 @@
+import itertools
+from unittest import TestCase
+
+from pygolf.name_finder import NameFinder
+
+
+class TestNameFinder(TestCase):
+    def test_pop_next_name(self):
+        name_finder = NameFinder()
+        names = [name_finder.pop_next_name() for _ in range(2000)]
+        self.assertEqual(names[:3], ["Z", "Y", "X"])
+        self.assertEqual(names[26:28], ["z", "y"])
+        self.assertEqual(names[52:55], ["ZZ", "ZY", "ZX"])
+        self.assertEqual(len(set(names)), len(names))
+        self.assertTrue(all(name.isidentifier() for name in names))
+
+    def test_next_name(self):
+        name_finder = NameFinder()
+        self.assertEqual(name_finder.next_name(), "Z")
+        self.assertEqual(name_finder.next_name(), "Z")
+        name_finder.remove_used_name("Z")
+        name_finder.remove_used_name("ZZ")
+        self.assertEqual(name_finder.pop_next_name(), "Y")
+
+        names = list(itertools.islice(iter(name_finder.pop_next_name, None), 1000))
+        self.assertNotIn("ZZ", names)
+        self.assertNotIn("if", names)
+        self.assertNotIn("id", names)
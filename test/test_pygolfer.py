@@ -0,0 +1,152 @@
+import io
+import os
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from test.helper_testkit import code_examples
+from unittest import mock
+
+import astroid
+
+from pygolf.backends import StdlibBackend
+from pygolf.cache import LRUCache
+from pygolf.cancellation import CancellationToken, Deadline
+from pygolf.errors.shorten_failure import ShortenFailure
+from pygolf.helper import process_batch
+from pygolf.optimization_phases import AlwaysApplyPhase, Phase
+from pygolf.pygolfer import Pygolfer
+from pygolf.rules import AstroidRule
+
+
+class UnstablePygolfer(Pygolfer):
+    def shorten(self, code: str) -> str:
+        if code == "crash":
+            os._exit(1)
+        if code == "sleep":
+            time.sleep(10)
+        return super().shorten(code)
+
+
+class FailingRule(AstroidRule):
+    on_node = astroid.Call
+
+    def transform(self, node: astroid.Call) -> astroid.Call:
+        raise RuntimeError("failing rule")
+
+    def predicate(self, node: astroid.Call) -> bool:
+        return True
+
+
+class FailingPhase(Phase):
+    def generate_rules(self, ast, cancellation=None, index=None):
+        yield FailingRule()
+
+
+class TestPygolfer(unittest.TestCase):
+    def test_shorten_parses_once(self):
+        with mock.patch.object(astroid, "parse", wraps=astroid.parse) as parse:
+            Pygolfer().shorten("for i in range(2):print('{}'.format(3))\nlong_name=2")
+        self.assertEqual(parse.call_count, 1)
+
+    def test_shorten_code_examples(self):
+        pygolfer = Pygolfer()
+        for code, expected in code_examples():
+            self.assertEqual(pygolfer.shorten(code), expected)
+            self.assertEqual(pygolfer.shorten(code, backend=StdlibBackend()), expected)
+
+    def test_shorten_to(self):
+        for code in ["long_name = 2\nprint(long_name)", "for i in range(2):\n    print( i )\nx = 3", ""]:
+            for pygolfer in [Pygolfer(), Pygolfer(cache=LRUCache())]:
+                sink = io.StringIO()
+                self.assertEqual(pygolfer.shorten_to(code, sink), len(pygolfer.shorten(code)))
+                self.assertEqual(sink.getvalue(), pygolfer.shorten(code))
+
+    def test_shorten_with_stdlib_backend(self):
+        with mock.patch.object(astroid, "parse", wraps=astroid.parse) as parse:
+            self.assertEqual(Pygolfer().shorten("long_name = 2", backend=StdlibBackend()), "Z=2")
+        self.assertEqual(parse.call_count, 0)
+
+    def test_shorten_with_cache(self):
+        cache = LRUCache()
+        pygolfer = Pygolfer(cache=cache)
+        self.assertEqual(pygolfer.shorten("long_name = 2"), "Z=2")
+        with mock.patch.object(astroid, "parse", wraps=astroid.parse) as parse:
+            self.assertEqual(pygolfer.shorten("long_name = 2"), "Z=2")
+        self.assertEqual(parse.call_count, 0)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        self.assertEqual(Pygolfer(phases=[AlwaysApplyPhase()], cache=cache).shorten("long_name = 2"), "long_name=2")
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_shorten_before_deadline(self):
+        deadline = Deadline.after(60)
+        self.assertEqual(Pygolfer().shorten("long_name = 2", deadline=deadline), "Z=2")
+        self.assertFalse(deadline.stopped_early)
+
+    def test_shorten_after_deadline_returns_code(self):
+        deadline = Deadline.after(0)
+        cache = LRUCache()
+        self.assertEqual(Pygolfer(cache=cache).shorten("long_name = 2", deadline=deadline), "long_name = 2")
+        self.assertTrue(deadline.stopped_early)
+        self.assertEqual(len(cache), 0)
+
+    def test_shorten_cancelled_returns_last_completed_phase(self):
+        class CancelAfterFirstPhase(AlwaysApplyPhase):
+            def generate_rules(self, ast, cancellation=None, index=None):
+                cancellation.cancel()
+                yield from super().generate_rules(ast, cancellation, index)
+
+        token = CancellationToken()
+        pygolfer = Pygolfer(phases=[AlwaysApplyPhase(), CancelAfterFirstPhase()])
+        self.assertEqual(
+            pygolfer.shorten("for i in range(2):print('{}'.format(i))", cancellation=token), "for i in range(2):print(f'{i}')"
+        )
+        self.assertTrue(token.stopped_early)
+
+    def test_shorten_from_several_threads(self):
+        codes = [f"long_name_{i}=input()\nfor j in range({i}):print('{{}}'.format(long_name_{i}))" for i in range(64)]
+        pygolfer = Pygolfer()
+        expected = [pygolfer.shorten(code) for code in codes]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(4):
+                self.assertEqual(list(executor.map(pygolfer.shorten, codes)), expected)
+
+    def test_shorten_failure_leaves_no_rule(self):
+        code = "for i in range(2):print('{}'.format(i))"
+        with self.assertRaises(RuntimeError):
+            Pygolfer(phases=[AlwaysApplyPhase(), FailingPhase()]).shorten(code)
+        self.assertEqual(Pygolfer().shorten(code), "for i in range(2):print(f'{i}')")
+
+    def test_shorten_many(self):
+        codes = ["print( 1 + 2 )", "not valid code", "long_name=2", "x=" + "+".join(["a"] * 5000), "a = 3"]
+        results = list(Pygolfer().shorten_many(iter(codes), workers=2, chunksize=2))
+
+        self.assertEqual(results[:3], ["print(1+2)", None, "Z=2"])
+        self.assertIsInstance(results[3], ShortenFailure)
+        self.assertIn("RecursionError", results[3].reason)
+        self.assertEqual(results[4], "a=3")
+
+    def test_shorten_many_sends_pygolfer_with_chunks(self):
+        with mock.patch.object(process_batch, "ProcessPoolExecutor", wraps=process_batch.ProcessPoolExecutor) as executor:
+            results = list(Pygolfer(cache=LRUCache()).shorten_many(["a = 1", "b = 2", "c = 3"], workers=2))
+        self.assertEqual(results, ["a=1", "b=2", "c=3"])
+        # The initializer of the workers does not exist in python 3.6
+        executor.assert_called_once_with(max_workers=2)
+
+    def test_shorten_many_rejects_timeout_without_timer(self):
+        with mock.patch.object(process_batch, "signal", spec=[]):
+            with self.assertRaises(ValueError):
+                list(Pygolfer().shorten_many(["a = 1"], timeout=1))
+
+    def test_shorten_many_isolates_crashes_and_timeouts(self):
+        codes = ["a = 1", "crash", "b = 2", "sleep", "c = 3"] + [f"d = {i}" for i in range(10)]
+        results = list(UnstablePygolfer().shorten_many(codes, workers=2, chunksize=3, timeout=1))
+
+        self.assertEqual(results[0], "a=1")
+        self.assertIsInstance(results[1], ShortenFailure)
+        self.assertEqual(results[1].reason, "worker process crashed")
+        self.assertEqual(results[2], "b=2")
+        self.assertIsInstance(results[3], ShortenFailure)
+        self.assertEqual(results[3].reason, "timed out after 1 seconds")
+        self.assertEqual(results[4:], ["c=3"] + [f"d={i}" for i in range(10)])
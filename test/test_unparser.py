@@ -1,6 +1,8 @@
+import io
 import unittest
+from unittest import mock
 
-from astroid import extract_node, parse
+from astroid import BinOp, BoolOp, Call, Name, extract_node, parse
 
 from pygolf.unparser import Unparser
 
@@ -9,6 +11,75 @@ class TestUnparser(unittest.TestCase):
 
     unparser = Unparser()
 
+    def test_unparse_each_node_once(self):
+        node = extract_node("a and (b and (c and (d and (e and (f and (g and (h and (i and j))))))))")
+        unparse_name = mock.Mock(side_effect=Unparser._unparse_Name)
+        with mock.patch.dict(Unparser._writers, {Name: unparse_name}):
+            self.assertEqual(Unparser().unparse(node), "a and b and c and d and e and f and g and h and i and j")
+        self.assertEqual(unparse_name.call_count, 10)
+
+    def test_unparse_with_subclass_writer(self):
+        class UpperCaseUnparser(Unparser):
+            def _unparse_Name(self, node, indent=0):
+                self._write(node.name.upper())
+
+        self.assertEqual(UpperCaseUnparser().unparse(extract_node("a + b")), "A+B")
+        self.assertEqual(UpperCaseUnparser().unparse_Name(extract_node("a")), "A")
+        self.assertEqual(Unparser().unparse(extract_node("a + b")), "a+b")
+
+    def test_unparse_to_huge_statement(self):
+        for code in [
+            "x=[" + ",".join(map(str, range(5000))) + "]",
+            "def f():\n" + "".join(f" a{i}=print()\n" for i in range(2000)),
+        ]:
+            module = parse(code)
+            stream = io.StringIO()
+            with mock.patch.object(stream, "write", wraps=stream.write) as write:
+                self.assertEqual(Unparser().unparse_to(module, stream), len(self.unparser.unparse(module)))
+            self.assertEqual(stream.getvalue(), self.unparser.unparse(module))
+            self.assertGreater(write.call_count, 4)
+            self.assertLess(max(len(call.args[0]) for call in write.call_args_list), len(stream.getvalue()) / 4)
+
+    def test_unparse_to_in_small_chunks(self):
+        module = parse("for i in range(2):\n    print(f'{i!r:>3}', -i if i else not i, [j for j in i if j if 1])\nelse:x=1")
+        unparser = Unparser()
+        unparser.chunk_size = 1
+        stream = io.StringIO()
+        unparser.unparse_to(module, stream)
+        self.assertEqual(stream.getvalue(), self.unparser.unparse(module))
+
+    def test_unparse_deeply_nested_code(self):
+        depth = 100000
+        bin_op, call, bool_op = Name(name="a"), Name(name="a"), Name(name="a")
+        for _ in range(depth):
+            bin_op, operand = BinOp(op="+"), bin_op
+            bin_op.postinit(operand, Name(name="b"))
+            call, argument = Call(), call
+            call.postinit(Name(name="f"), [argument], [])
+            bool_op, operand = BoolOp(op="and"), bool_op
+            bool_op.postinit([Name(name="b"), operand])
+
+        self.assertEqual(self.unparser.unparse(bin_op), "a" + "+b" * depth)
+        self.assertEqual(self.unparser.unparse(call), "f(" * depth + "a" + ")" * depth)
+        self.assertEqual(self.unparser.unparse(bool_op), "b and " * depth + "a")
+
+    def test_unparse_length(self):
+        node = parse(
+            """
+def f(a, b=2):
+    return [x for x in a if x if not x]
+print(f"{a!r:>3}", "x" if a else "y")
+"""
+        )
+        unparser = Unparser()
+        self.assertEqual(unparser.unparse_length(node), len(unparser.unparse(node)))
+        self.assertEqual(unparser.unparse_length(node.body[0], 1), len(unparser.unparse(node.body[0], 1)))
+
+        unparse_name = mock.Mock(side_effect=Unparser._unparse_Name)
+        with mock.patch.dict(Unparser._writers, {Name: unparse_name}):
+            self.assertEqual(unparser.unparse_length(node), 80)
+        unparse_name.assert_not_called()
+
     def test_unparse_for(self):
         async_for = extract_node("async for thing in things:pass")
 